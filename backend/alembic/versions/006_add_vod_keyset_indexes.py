@@ -0,0 +1,26 @@
+"""Add keyset pagination indexes for VOD listings
+
+Revision ID: 006_add_vod_keyset_indexes
+Revises: 005_add_performance_indexes
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006_add_vod_keyset_indexes'
+down_revision = '005_add_performance_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index (is_active, title, id) so VOD pages are an index range scan."""
+    op.create_index('idx_vod_movies_active_title_id', 'vod_movies', ['is_active', 'title', 'id'])
+    op.create_index('idx_vod_series_active_title_id', 'vod_series', ['is_active', 'title', 'id'])
+
+
+def downgrade() -> None:
+    """Remove keyset pagination indexes."""
+    op.drop_index('idx_vod_series_active_title_id')
+    op.drop_index('idx_vod_movies_active_title_id')
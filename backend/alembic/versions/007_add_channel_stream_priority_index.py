@@ -0,0 +1,28 @@
+"""Add composite index for best-stream lookups
+
+Revision ID: 007_add_channel_stream_priority_index
+Revises: 006_add_vod_keyset_indexes
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007_add_channel_stream_priority_index'
+down_revision = '006_add_vod_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index (channel_id, priority_order, is_active) for per-channel best-stream seeks."""
+    op.create_index(
+        'idx_channel_streams_channel_priority_active',
+        'channel_streams',
+        ['channel_id', 'priority_order', 'is_active'],
+    )
+
+
+def downgrade() -> None:
+    """Remove best-stream index."""
+    op.drop_index('idx_channel_streams_channel_priority_active')
@@ -0,0 +1,24 @@
+"""Add composite index for category-filtered channel queries
+
+Revision ID: 008_add_channel_category_index
+Revises: 007_add_channel_stream_priority_index
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008_add_channel_category_index'
+down_revision = '007_add_channel_stream_priority_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index (category, enabled) so category filters resolve in the index."""
+    op.create_index('idx_channels_category_enabled', 'channels', ['category', 'enabled'])
+
+
+def downgrade() -> None:
+    """Remove category index."""
+    op.drop_index('idx_channels_category_enabled')
@@ -0,0 +1,31 @@
+"""Replace single-column EPG indexes with a (channel, start) composite
+
+Revision ID: 009_add_epg_program_indexes
+Revises: 008_add_channel_category_index
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '009_add_epg_program_indexes'
+down_revision = '008_add_channel_category_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index (channel_epg_id, start_time) and end_time for schedule range scans."""
+    op.create_index('idx_epg_programs_channel_start', 'epg_programs', ['channel_epg_id', 'start_time'])
+    op.create_index('idx_epg_programs_end_time', 'epg_programs', ['end_time'])
+    # Both are covered by the composite's leading column or no longer used alone
+    op.drop_index('ix_epg_programs_channel_epg_id', table_name='epg_programs')
+    op.drop_index('ix_epg_programs_start_time', table_name='epg_programs')
+
+
+def downgrade() -> None:
+    """Restore the single-column EPG indexes."""
+    op.create_index('ix_epg_programs_start_time', 'epg_programs', ['start_time'])
+    op.create_index('ix_epg_programs_channel_epg_id', 'epg_programs', ['channel_epg_id'])
+    op.drop_index('idx_epg_programs_end_time')
+    op.drop_index('idx_epg_programs_channel_start')
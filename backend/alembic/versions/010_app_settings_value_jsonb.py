@@ -0,0 +1,37 @@
+"""Store app_settings.value as JSONB
+
+Revision ID: 010_app_settings_value_jsonb
+Revises: 009_add_epg_program_indexes
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010_app_settings_value_jsonb'
+down_revision = '009_add_epg_program_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Convert the JSON-encoded text values to JSONB."""
+    # Values were written with json.dumps; anything that does not parse is kept as a JSON string
+    op.execute("""
+        CREATE FUNCTION pg_temp.settings_value_to_jsonb(v text) RETURNS jsonb AS $$
+        BEGIN
+            RETURN v::jsonb;
+        EXCEPTION WHEN others THEN
+            RETURN to_jsonb(v);
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        "ALTER TABLE app_settings ALTER COLUMN value TYPE jsonb "
+        "USING pg_temp.settings_value_to_jsonb(value)"
+    )
+
+
+def downgrade() -> None:
+    """Store values as JSON text again."""
+    op.execute("ALTER TABLE app_settings ALTER COLUMN value TYPE text USING value::text")
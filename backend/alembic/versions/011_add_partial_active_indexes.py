@@ -0,0 +1,44 @@
+"""Add partial indexes for enabled channels and active streams
+
+Revision ID: 011_add_partial_active_indexes
+Revises: 010_app_settings_value_jsonb
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011_add_partial_active_indexes'
+down_revision = '010_app_settings_value_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index only the rows the lineup and best-stream queries can return."""
+    op.create_index(
+        'idx_channels_lineup',
+        'channels',
+        ['category', 'name'],
+        postgresql_where=sa.text('enabled AND stream_count > 0'),
+    )
+    op.create_index(
+        'idx_channel_streams_active_priority',
+        'channel_streams',
+        ['channel_id', 'priority_order'],
+        postgresql_where=sa.text('is_active'),
+    )
+    # Superseded by the partial index above
+    op.drop_index('idx_channel_streams_channel_priority_active')
+
+
+def downgrade() -> None:
+    """Restore the full best-stream index."""
+    op.create_index(
+        'idx_channel_streams_channel_priority_active',
+        'channel_streams',
+        ['channel_id', 'priority_order', 'is_active'],
+    )
+    op.drop_index('idx_channel_streams_active_priority')
+    op.drop_index('idx_channels_lineup')
@@ -0,0 +1,75 @@
+"""Maintain channels.stream_count with a trigger on channel_streams
+
+Revision ID: 012_channel_stream_count_trigger
+Revises: 011_add_partial_active_indexes
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '012_channel_stream_count_trigger'
+down_revision = '011_add_partial_active_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Recount active streams once per statement for the channels it touched."""
+    # Statement-level with transition tables: a batched insert of N streams
+    # issues one UPDATE for the affected channels, not N
+    op.execute("""
+        CREATE FUNCTION refresh_channel_stream_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE channels c SET stream_count = (
+                    SELECT count(*) FROM channel_streams s WHERE s.channel_id = c.id AND s.is_active
+                ) WHERE c.id IN (SELECT channel_id FROM new_rows);
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE channels c SET stream_count = (
+                    SELECT count(*) FROM channel_streams s WHERE s.channel_id = c.id AND s.is_active
+                ) WHERE c.id IN (SELECT channel_id FROM old_rows);
+            ELSE
+                UPDATE channels c SET stream_count = (
+                    SELECT count(*) FROM channel_streams s WHERE s.channel_id = c.id AND s.is_active
+                ) WHERE c.id IN (
+                    SELECT n.channel_id FROM new_rows n JOIN old_rows o ON o.id = n.id
+                    WHERE n.channel_id IS DISTINCT FROM o.channel_id OR n.is_active IS DISTINCT FROM o.is_active
+                    UNION
+                    SELECT o.channel_id FROM new_rows n JOIN old_rows o ON o.id = n.id
+                    WHERE n.channel_id IS DISTINCT FROM o.channel_id OR n.is_active IS DISTINCT FROM o.is_active
+                );
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER channel_streams_count_insert AFTER INSERT ON channel_streams
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION refresh_channel_stream_count()
+    """)
+    op.execute("""
+        CREATE TRIGGER channel_streams_count_update AFTER UPDATE ON channel_streams
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION refresh_channel_stream_count()
+    """)
+    op.execute("""
+        CREATE TRIGGER channel_streams_count_delete AFTER DELETE ON channel_streams
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION refresh_channel_stream_count()
+    """)
+    # Bring existing counts in line with what the trigger maintains
+    op.execute("""
+        UPDATE channels c SET stream_count = (
+            SELECT count(*) FROM channel_streams s WHERE s.channel_id = c.id AND s.is_active
+        )
+    """)
+
+
+def downgrade() -> None:
+    """Drop the stream-count triggers."""
+    op.execute("DROP TRIGGER IF EXISTS channel_streams_count_delete ON channel_streams")
+    op.execute("DROP TRIGGER IF EXISTS channel_streams_count_update ON channel_streams")
+    op.execute("DROP TRIGGER IF EXISTS channel_streams_count_insert ON channel_streams")
+    op.execute("DROP FUNCTION IF EXISTS refresh_channel_stream_count()")
@@ -0,0 +1,33 @@
+"""Store channels.logo_hash as a 64-bit integer
+
+Revision ID: 013_logo_hash_bigint
+Revises: 012_channel_stream_count_trigger
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '013_logo_hash_bigint'
+down_revision = '012_channel_stream_count_trigger'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Convert 16-digit hex average hashes to bigint; anything else becomes NULL."""
+    op.execute("""
+        ALTER TABLE channels ALTER COLUMN logo_hash TYPE bigint USING (
+            CASE WHEN logo_hash ~* '^[0-9a-f]{16}$'
+                 THEN ('x' || logo_hash)::bit(64)::bigint
+            END
+        )
+    """)
+
+
+def downgrade() -> None:
+    """Store logo hashes as hex strings again."""
+    op.execute("""
+        ALTER TABLE channels ALTER COLUMN logo_hash TYPE varchar(64)
+        USING lpad(to_hex(logo_hash), 16, '0')
+    """)
@@ -0,0 +1,32 @@
+"""Store EPG program times as naive UTC timestamps
+
+Revision ID: 014_epg_naive_utc_timestamps
+Revises: 013_logo_hash_bigint
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '014_epg_naive_utc_timestamps'
+down_revision = '013_logo_hash_bigint'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Convert start_time/end_time to timestamp without time zone, in UTC."""
+    op.execute("""
+        ALTER TABLE epg_programs
+            ALTER COLUMN start_time TYPE timestamp USING start_time AT TIME ZONE 'UTC',
+            ALTER COLUMN end_time TYPE timestamp USING end_time AT TIME ZONE 'UTC'
+    """)
+
+
+def downgrade() -> None:
+    """Store start_time/end_time as timestamptz again."""
+    op.execute("""
+        ALTER TABLE epg_programs
+            ALTER COLUMN start_time TYPE timestamptz USING start_time AT TIME ZONE 'UTC',
+            ALTER COLUMN end_time TYPE timestamptz USING end_time AT TIME ZONE 'UTC'
+    """)
@@ -0,0 +1,34 @@
+"""Store provider metadata and channel tags as JSONB
+
+Revision ID: 015_metadata_columns_jsonb
+Revises: 014_epg_naive_utc_timestamps
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '015_metadata_columns_jsonb'
+down_revision = '014_epg_naive_utc_timestamps'
+branch_labels = None
+depends_on = None
+
+COLUMNS = (
+    ('channels', 'tags'),
+    ('channel_streams', 'provider_metadata'),
+    ('vod_movies', 'provider_metadata'),
+    ('vod_series', 'provider_metadata'),
+    ('vod_episodes', 'provider_metadata'),
+)
+
+
+def upgrade() -> None:
+    """Convert the textual json columns to jsonb."""
+    for table, column in COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+
+
+def downgrade() -> None:
+    """Store the columns as json text again."""
+    for table, column in COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json")
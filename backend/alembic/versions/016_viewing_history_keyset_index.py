@@ -0,0 +1,32 @@
+"""Index viewing history for newest-first keyset paging
+
+Revision ID: 016_viewing_history_keyset_index
+Revises: 015_metadata_columns_jsonb
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '016_viewing_history_keyset_index'
+down_revision = '015_metadata_columns_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace (user_id, started_at) with an index matching the history ORDER BY."""
+    op.create_index(
+        'ix_viewing_history_user_recent',
+        'viewing_history',
+        ['user_id', sa.text('started_at DESC'), sa.text('id DESC')],
+    )
+    # Covered by the new index's leading columns
+    op.drop_index('ix_viewing_history_user_started', table_name='viewing_history')
+
+
+def downgrade() -> None:
+    """Restore the original (user_id, started_at) index."""
+    op.create_index('ix_viewing_history_user_started', 'viewing_history', ['user_id', 'started_at'])
+    op.drop_index('ix_viewing_history_user_recent', table_name='viewing_history')
@@ -0,0 +1,34 @@
+"""Constrain provider and merge rule types
+
+Revision ID: 017_add_type_check_constraints
+Revises: 016_viewing_history_keyset_index
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '017_add_type_check_constraints'
+down_revision = '016_viewing_history_keyset_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Reject provider_type/rule_type values the application does not handle."""
+    op.create_check_constraint(
+        'ck_providers_provider_type',
+        'providers',
+        "provider_type IN ('xstream', 'm3u')",
+    )
+    op.create_check_constraint(
+        'ck_merge_rules_rule_type',
+        'merge_rules',
+        "rule_type IN ('never_merge', 'always_merge', 'custom')",
+    )
+
+
+def downgrade() -> None:
+    """Drop the type constraints."""
+    op.drop_constraint('ck_merge_rules_rule_type', 'merge_rules', type_='check')
+    op.drop_constraint('ck_providers_provider_type', 'providers', type_='check')
@@ -1,3 +1 @@
 # make 'app' a package explicitly
-from .core.config import settings
-__all__ = ["settings"]
@@ -1,9 +1,10 @@
 """Analytics and viewing history API endpoints."""
 from typing import List, Optional
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from urllib.parse import urlencode
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc
+from sqlalchemy import select, func, desc, tuple_
 from sqlalchemy.orm import selectinload
 from pydantic import BaseModel
 from app.core.database import get_db
@@ -225,13 +226,20 @@ async def update_viewing_session(
 
 @router.get("/history", response_model=List[ViewingHistoryResponse])
 async def get_viewing_history(
+    response: Response,
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    before_started_at: Optional[datetime] = None,
+    before_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get current user's viewing history."""
-    result = await db.execute(
+    """Get current user's viewing history, newest first.
+
+    Pass ``before_started_at``/``before_id`` (from the ``X-Next-Cursor`` header)
+    instead of ``offset`` to page by index seek rather than scanning past skipped rows.
+    """
+    query = (
         select(ViewingHistory)
         .options(
             selectinload(ViewingHistory.channel),
@@ -239,12 +247,25 @@ async def get_viewing_history(
             selectinload(ViewingHistory.vod_series)
         )
         .where(ViewingHistory.user_id == current_user.id)
-        .order_by(ViewingHistory.started_at.desc())
-        .limit(limit)
-        .offset(offset)
+    )
+    if before_started_at is not None and before_id is not None:
+        query = query.where(
+            tuple_(ViewingHistory.started_at, ViewingHistory.id) < (before_started_at, before_id)
+        )
+    elif offset:
+        query = query.offset(offset)
+
+    result = await db.execute(
+        query.order_by(ViewingHistory.started_at.desc(), ViewingHistory.id.desc()).limit(limit)
     )
     history = result.scalars().all()
 
+    if len(history) == limit:
+        last = history[-1]
+        response.headers["X-Next-Cursor"] = urlencode(
+            {"before_started_at": last.started_at.isoformat(), "before_id": last.id}
+        )
+
     return [
         ViewingHistoryResponse(
             id=h.id,
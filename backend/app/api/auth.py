@@ -5,19 +5,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
-from passlib.context import CryptContext
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from app.core.database import get_db
 from app.core.config import settings
+from app.core.rate_limit import limiter
+from app.core.security import pwd_context
 from app.models.user import User
 
 router = APIRouter()
-limiter = Limiter(key_func=get_remote_address)
 
-# Password hashing - using argon2 for modern security
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
 
 ALGORITHM = "HS256"
@@ -1,16 +1,22 @@
 """Channels API endpoints."""
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from sqlalchemy.orm import load_only, raiseload
 from pydantic import BaseModel
-from app.core.database import get_db
+from app.core.cache import CacheManager, CHANNEL_CATEGORIES_KEY, conditional_json_response
+from app.core.database import get_db, get_db_readonly
 from app.models.channel import Channel, ChannelStream
 from app.models.provider import Provider
 from app.services.health_checker import StreamHealthChecker
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+CATEGORIES_CACHE_TTL = 300  # seconds
+CATEGORIES_MAX_AGE = 60  # seconds clients may reuse their copy without revalidating
 
 
 class ChannelResponse(BaseModel):
@@ -29,6 +35,10 @@ class ChannelResponse(BaseModel):
         from_attributes = True
 
 
+# Only the columns ChannelResponse renders; the rest of the row stays in Postgres
+_CHANNEL_COLUMNS = tuple(getattr(Channel, name) for name in ChannelResponse.model_fields)
+
+
 class StreamResponse(BaseModel):
     id: int
     channel_id: int
@@ -72,10 +82,11 @@ async def list_channels(
     enabled: Optional[bool] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """List channels with optional filtering."""
-    query = select(Channel)
+    # ChannelResponse has no relationship fields; raiseload keeps it that way
+    query = select(Channel).options(load_only(*_CHANNEL_COLUMNS), raiseload("*"))
 
     if category:
         query = query.where(Channel.category == category)
@@ -91,9 +102,9 @@ async def list_channels(
 
 
 @router.get("/{channel_id}", response_model=ChannelResponse)
-async def get_channel(channel_id: int, db: AsyncSession = Depends(get_db)):
+async def get_channel(channel_id: int, db: AsyncSession = Depends(get_db_readonly)):
     """Get channel details."""
-    result = await db.execute(select(Channel).where(Channel.id == channel_id))
+    result = await db.execute(select(Channel).where(Channel.id == channel_id).options(load_only(*_CHANNEL_COLUMNS), raiseload("*")))
     channel = result.scalar_one_or_none()
 
     if not channel:
@@ -103,7 +114,7 @@ async def get_channel(channel_id: int, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/{channel_id}/streams", response_model=List[StreamResponse])
-async def get_channel_streams(channel_id: int, db: AsyncSession = Depends(get_db)):
+async def get_channel_streams(channel_id: int, db: AsyncSession = Depends(get_db_readonly)):
     """Get all streams for a channel with provider names."""
     result = await db.execute(
         select(ChannelStream, Provider.name)
@@ -140,16 +151,25 @@ async def get_channel_streams(channel_id: int, db: AsyncSession = Depends(get_db
 
 
 @router.get("/categories/list")
-async def list_categories(db: AsyncSession = Depends(get_db)):
-    """Get list of all channel categories."""
+async def list_categories(request: Request, db: AsyncSession = Depends(get_db_readonly)):
+    """Get list of all channel categories.
+
+    Categories only change on provider sync, so the result is cached until the
+    sync invalidates it (or the TTL expires).
+    """
+    payload = await CacheManager.get_raw(CHANNEL_CATEGORIES_KEY)
+    if payload is not None:
+        return conditional_json_response(request, payload, CATEGORIES_MAX_AGE)
+
     result = await db.execute(
         select(Channel.category, func.count(Channel.id))
         .group_by(Channel.category)
         .order_by(Channel.category)
     )
     categories = [{"name": cat, "count": count} for cat, count in result.all() if cat]
+    payload = await CacheManager.set(CHANNEL_CATEGORIES_KEY, categories, ttl=CATEGORIES_CACHE_TTL)
 
-    return categories
+    return conditional_json_response(request, payload, CATEGORIES_MAX_AGE)
 
 
 @router.patch("/streams/{stream_id}", response_model=StreamResponse)
@@ -172,6 +192,7 @@ async def update_stream(
         stream.priority_order = update.priority_order
 
     await db.commit()
+    await CacheManager.invalidate_channel_cache()
     await db.refresh(stream)
 
     # Get provider name
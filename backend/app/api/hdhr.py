@@ -1,20 +1,33 @@
 """HDHomeRun emulation API endpoints."""
 from fastapi import APIRouter, Depends, Response, HTTPException, Request
-from fastapi.responses import RedirectResponse, StreamingResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
+from app.core.cache import CacheManager, HDHR_LINEUP_PREFIX, LINEUP_VERSION_KEY
+from app.core.database import get_db_readonly
 from app.core.config import settings
 from app.services.hdhr_emulator import HDHomeRunEmulator
+import hashlib
 import httpx
+import orjson
 from app.services.stream_connection_manager import stream_manager
 import logging
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 # Initialize emulator
 hdhr = HDHomeRunEmulator()
 
+# Settings read on every request, resolved once at import
+_EXTERNAL_URL = (getattr(settings, 'EXTERNAL_URL', None) or '').rstrip('/') or None
+_PROXY_MODE = getattr(settings, 'HDHR_PROXY_MODE', 'direct')
+_FALLBACK_PORT = getattr(settings, 'API_PORT', settings.BACKEND_PORT)
+
+# Rendered lineups are keyed by ETag, so a stale entry is never served;
+# the TTL only bounds how long superseded versions linger in Redis.
+LINEUP_CACHE_TTL = 600
+LINEUP_MAX_AGE = 60  # seconds clients may reuse their copy without revalidating
+
 
 def get_base_url(request: Request) -> str:
     """
@@ -27,8 +40,8 @@ def get_base_url(request: Request) -> str:
         Base URL (e.g., http://192.168.1.100:8000)
     """
     # Use configured external URL if provided
-    if settings.EXTERNAL_URL:
-        return settings.EXTERNAL_URL.rstrip('/')
+    if _EXTERNAL_URL:
+        return _EXTERNAL_URL
 
     # Auto-detect from request
     scheme = request.url.scheme
@@ -45,29 +58,62 @@ def get_base_url(request: Request) -> str:
         return f"{scheme}://{host_header}"
 
     # Fallback
-    return f"{scheme}://{host}:{settings.API_PORT}"
+    return f"{scheme}://{host}:{_FALLBACK_PORT}"
 
 
 @router.get("/discover.json")
 async def discover(request: Request):
     """HDHomeRun device discovery endpoint."""
     base_url = get_base_url(request)
-    return hdhr.get_discover_data(base_url)
+    return ORJSONResponse(hdhr.get_discover_data(base_url))
 
 
 @router.get("/lineup_status.json")
 async def lineup_status():
     """HDHomeRun lineup status endpoint."""
-    return hdhr.get_lineup_status()
+    return ORJSONResponse(hdhr.get_lineup_status())
+
+
+def _lineup_digest(version: str, base_url: str) -> str:
+    """Fingerprint the lineup: channel data version plus what shapes the URLs."""
+    return hashlib.blake2b(
+        repr((version, base_url, _PROXY_MODE)).encode(), digest_size=16
+    ).hexdigest()
 
 
 @router.get("/lineup.json")
-async def lineup(request: Request, db: AsyncSession = Depends(get_db)):
-    """HDHomeRun channel lineup endpoint."""
+async def lineup(request: Request, db: AsyncSession = Depends(get_db_readonly)):
+    """HDHomeRun channel lineup endpoint.
+
+    Clients poll this regularly, so it answers 304 when their copy is current
+    and otherwise serves the rendered lineup from Redis when available. The
+    ETag comes from a Redis counter that channel writers bump after committing,
+    so a poll costs no database query.
+    """
     base_url = get_base_url(request)
-    # Get proxy mode from settings
-    proxy_mode = settings.HDHR_PROXY_MODE
-    return await hdhr.get_lineup(db, base_url, proxy_mode)
+    version = await CacheManager.version(LINEUP_VERSION_KEY)
+    if version is None:
+        # Redis is down: nothing to validate against, so always render
+        return ORJSONResponse(await hdhr.get_lineup(db, base_url, _PROXY_MODE))
+
+    digest = _lineup_digest(version, base_url)
+    etag = f'"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={LINEUP_MAX_AGE}"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    key = f"{HDHR_LINEUP_PREFIX}{digest}"
+    payload = await CacheManager.get_raw(key)
+    if payload is None:
+        channels = await hdhr.get_lineup(db, base_url, _PROXY_MODE)
+        # get_lineup returns [] on failure; don't pin that under the ETag
+        if channels:
+            payload = await CacheManager.set(key, channels, ttl=LINEUP_CACHE_TTL)
+        else:
+            payload = orjson.dumps(channels)
+
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 
 @router.get("/device.xml")
@@ -79,7 +125,7 @@ async def device_xml(request: Request):
 
 
 @router.get("/auto/v{channel_id}")
-async def stream_channel(channel_id: int, db: AsyncSession = Depends(get_db)):
+async def stream_channel(channel_id: int, db: AsyncSession = Depends(get_db_readonly)):
     """
     Stream a channel (proxy mode endpoint).
 
@@ -93,10 +139,7 @@ async def stream_channel(channel_id: int, db: AsyncSession = Depends(get_db)):
         if not stream_url:
             raise HTTPException(status_code=404, detail="Channel not found or no active stream")
 
-        # Get proxy mode from settings
-        proxy_mode = getattr(settings, 'HDHR_PROXY_MODE', 'direct')
-
-        if proxy_mode == "direct":
+        if _PROXY_MODE == "direct":
             # Redirect to original stream
             return RedirectResponse(url=stream_url, status_code=302)
         else:
@@ -170,4 +213,4 @@ async def _proxy_stream(stream_url: str):
 async def lineup_post():
     """Handle lineup POST request (scan channels)."""
     # Return success - we don't actually scan
-    return {"success": True, "message": "Scan not required for IPTV"}
+    return ORJSONResponse({"success": True, "message": "Scan not required for IPTV"})
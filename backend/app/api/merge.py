@@ -10,12 +10,14 @@ from pydantic import BaseModel
 from typing import List, Optional
 import re
 
+from app.core.cache import CacheManager
 from app.core.database import get_db
 from app.models.channel import Channel, ChannelStream
 from app.models.merge_rule import MergeRule
 from app.models.provider import Provider
 from app.core.auth import get_current_user
 from app.models.user import User
+from app.services.channel_matcher import normalize_channel_name
 
 router = APIRouter()
 
@@ -38,7 +40,7 @@ class SplitChannelRequest(BaseModel):
 
 class MergeRuleCreate(BaseModel):
     """Create a new merge rule"""
-    rule_type: str  # 'never_merge', 'always_merge'
+    rule_type: str  # 'never_merge', 'always_merge', 'custom'
     pattern1: str
     pattern2: Optional[str] = None
     region1: Optional[str] = None
@@ -149,13 +151,12 @@ async def split_channel(
     # Create new channel
     new_channel = Channel(
         name=new_channel_name,
-        normalized_name=Channel.normalize_name(new_channel_name),
+        normalized_name=normalize_channel_name(new_channel_name),
         category=original_channel.category,
         region=original_channel.region,
         variant=original_channel.variant,
         logo_url=original_channel.logo_url,
-        enabled=True,
-        stream_count=len(streams_to_split)
+        enabled=True
     )
     db.add(new_channel)
     await db.flush()
@@ -172,10 +173,8 @@ async def split_channel(
         )
     )
     
-    # Update stream counts
-    original_channel.stream_count = len([s for s in original_channel.streams if s.id not in request.stream_ids])
-    
     await db.commit()
+    await CacheManager.invalidate_channel_cache()
     await db.refresh(new_channel)
     
     return {
@@ -226,17 +225,17 @@ async def merge_channels(
         )
     )
     
-    # Update stream count
+    # Streams now on the target (channels.stream_count itself is kept by a trigger)
     stream_count = await db.scalar(
         select(func.count(ChannelStream.id))
         .where(ChannelStream.channel_id == target_channel_id)
     )
-    target_channel.stream_count = stream_count
     
     # Delete source channel
     await db.delete(source_channel)
     
     await db.commit()
+    await CacheManager.invalidate_channel_cache()
     
     return {
         'success': True,
@@ -292,6 +291,10 @@ async def create_merge_rule(
     - Never merge "ABC East" with "ABC West"
     - Always merge "HBO" streams regardless of variant
     """
+    # Validate rule type (also enforced by a CHECK constraint)
+    if rule_data.rule_type not in ('never_merge', 'always_merge', 'custom'):
+        raise HTTPException(status_code=400, detail="Invalid rule type")
+
     # Validate regex patterns
     try:
         re.compile(rule_data.pattern1)
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel
+from app.core.cache import CacheManager
 from app.core.database import get_db
 from app.models.provider import Provider
 from app.services.provider_manager import ProviderManager
@@ -138,6 +139,8 @@ async def delete_provider(provider_id: int, db: AsyncSession = Depends(get_db)):
 
     await db.delete(provider)
     await db.commit()
+    # Its streams went with it (ON DELETE CASCADE)
+    await CacheManager.invalidate_channel_cache()
 
 
 @router.post("/{provider_id}/test")
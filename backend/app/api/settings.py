@@ -1,5 +1,4 @@
 """Settings API endpoints."""
-import json
 import logging
 from typing import Any, Dict, Optional
 from fastapi import APIRouter, Depends, HTTPException
@@ -241,7 +240,7 @@ async def initialize_default_settings(db: AsyncSession):
         if not existing:
             setting = AppSettings(
                 key=key,
-                value=json.dumps(config["value"]),
+                value=config["value"],
                 value_type=config["type"],
                 description=config["description"]
             )
@@ -265,14 +264,8 @@ async def list_all_settings(
     # Convert to dict with proper types
     settings_dict = {}
     for setting in settings:
-        try:
-            value = json.loads(setting.value) if setting.value else None
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.warning(f"Failed to parse setting {setting.key}: {e}")
-            value = setting.value
-
         settings_dict[setting.key] = {
-            "value": value,
+            "value": setting.value,
             "type": setting.value_type,
             "description": setting.description
         }
@@ -296,14 +289,8 @@ async def get_setting(
             return DEFAULT_SETTINGS[key]
         raise HTTPException(status_code=404, detail="Setting not found")
 
-    try:
-        value = json.loads(setting.value) if setting.value else None
-    except (json.JSONDecodeError, TypeError) as e:
-        logger.warning(f"Failed to parse setting {key}: {e}")
-        value = setting.value
-
     return {
-        "value": value,
+        "value": setting.value,
         "type": setting.value_type,
         "description": setting.description
     }
@@ -320,19 +307,17 @@ async def update_setting(
     result = await db.execute(select(AppSettings).where(AppSettings.key == key))
     setting = result.scalar_one_or_none()
 
-    value_str = json.dumps(data.value)
-
     if not setting:
         # Create new setting
         setting = AppSettings(
             key=key,
-            value=value_str,
+            value=data.value,
             value_type=type(data.value).__name__,
             description=DEFAULT_SETTINGS.get(key, {}).get("description")
         )
         db.add(setting)
     else:
-        setting.value = value_str
+        setting.value = data.value
 
     await db.commit()
     await db.refresh(setting)
@@ -358,18 +343,16 @@ async def bulk_update_settings(
         result = await db.execute(select(AppSettings).where(AppSettings.key == key))
         setting = result.scalar_one_or_none()
 
-        value_str = json.dumps(value)
-
         if not setting:
             setting = AppSettings(
                 key=key,
-                value=value_str,
+                value=value,
                 value_type=type(value).__name__,
                 description=DEFAULT_SETTINGS.get(key, {}).get("description")
             )
             db.add(setting)
         else:
-            setting.value = value_str
+            setting.value = value
 
         updated.append(key)
 
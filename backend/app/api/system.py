@@ -1,12 +1,14 @@
 """System configuration and management API."""
+import json
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from pydantic import BaseModel
 from typing import List, Dict, Any
 from pathlib import Path
-from app.core.config import settings, generate_secret_key
-from app.core.database import get_db
+from app.core.config import Settings, settings, get_settings, generate_secret_key
+from app.core.cache import local_cache, SYSTEM_STATS_KEY
+from app.core.database import AsyncSessionLocal, get_db, get_pool_status
 from app.models.provider import Provider
 from app.models.channel import Channel, ChannelStream
 from app.models.vod import VODMovie, VODSeries
@@ -25,6 +27,17 @@ class ConfigUpdate(BaseModel):
     backend_port: int = None
 
 
+# .env variable -> (ConfigUpdate field, value renderer)
+_ENV_FIELDS = {
+    'DEBUG': ('debug', lambda v: str(v).lower()),
+    'ALLOWED_ORIGINS': ('allowed_origins', json.dumps),
+    'HEALTH_CHECK_TIMEOUT': ('health_check_timeout', str),
+    'SYNC_INTERVAL': ('sync_interval', str),
+    'FRONTEND_PORT': ('frontend_port', str),
+    'BACKEND_PORT': ('backend_port', str),
+}
+
+
 class SecretKeyRotate(BaseModel):
     """Secret key rotation response."""
     new_secret_key: str
@@ -32,7 +45,7 @@ class SecretKeyRotate(BaseModel):
 
 
 @router.get("/config")
-async def get_configuration() -> Dict[str, Any]:
+async def get_configuration(settings: Settings = Depends(get_settings)) -> Dict[str, Any]:
     """Get current system configuration (safe values only)."""
     return {
         "app_name": settings.APP_NAME,
@@ -60,6 +73,13 @@ async def update_configuration(config: ConfigUpdate) -> Dict[str, str]:
     if not env_file.exists():
         raise HTTPException(status_code=500, detail=".env file not found")
     
+    # Resolve the submitted fields to their .env values once, keyed by variable name
+    updates = {
+        key: render(value)
+        for key, (field, render) in _ENV_FIELDS.items()
+        if (value := getattr(config, field)) is not None
+    }
+
     env_lines = env_file.read_text().split('\n')
     updated_lines = []
     
@@ -72,19 +92,8 @@ async def update_configuration(config: ConfigUpdate) -> Dict[str, str]:
             key, _ = line.split('=', 1)
             key = key.strip()
             
-            if config.debug is not None and key == 'DEBUG':
-                updated_lines.append(f'DEBUG={str(config.debug).lower()}')
-            elif config.allowed_origins is not None and key == 'ALLOWED_ORIGINS':
-                import json
-                updated_lines.append(f'ALLOWED_ORIGINS={json.dumps(config.allowed_origins)}')
-            elif config.health_check_timeout is not None and key == 'HEALTH_CHECK_TIMEOUT':
-                updated_lines.append(f'HEALTH_CHECK_TIMEOUT={config.health_check_timeout}')
-            elif config.sync_interval is not None and key == 'SYNC_INTERVAL':
-                updated_lines.append(f'SYNC_INTERVAL={config.sync_interval}')
-            elif config.frontend_port is not None and key == 'FRONTEND_PORT':
-                updated_lines.append(f'FRONTEND_PORT={config.frontend_port}')
-            elif config.backend_port is not None and key == 'BACKEND_PORT':
-                updated_lines.append(f'BACKEND_PORT={config.backend_port}')
+            if key in updates:
+                updated_lines.append(f'{key}={updates[key]}')
             else:
                 updated_lines.append(line)
         else:
@@ -136,30 +145,47 @@ async def system_health() -> Dict[str, Any]:
     }
 
 
+@router.get("/db-pool")
+async def db_pool_status() -> Dict[str, Any]:
+    """Get database connection pool usage."""
+    return get_pool_status()
+
+
 @router.get("/stats")
-async def get_system_stats(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
+async def get_system_stats() -> Dict[str, Any]:
     """Get system-wide statistics."""
-    # Count providers
-    total_providers = await db.scalar(select(func.count(Provider.id)))
-    active_providers = await db.scalar(
-        select(func.count(Provider.id)).where(Provider.enabled == True)
+    return await local_cache.get_or_compute(
+        SYSTEM_STATS_KEY, _compute_system_stats, ttl=settings.STATS_CACHE_TTL
     )
-    
-    # Count channels
-    total_channels = await db.scalar(select(func.count(Channel.id)))
-    
-    # Count VOD items
-    total_movies = await db.scalar(select(func.count(VODMovie.id)))
-    total_series = await db.scalar(select(func.count(VODSeries.id)))
-    total_vod_items = (total_movies or 0) + (total_series or 0)
-    
+
+
+async def _compute_system_stats() -> Dict[str, Any]:
+    """Gather all system counts in a single round trip.
+
+    Opens its own session: coalesced callers all await this loader, so it
+    must outlive whichever request happened to start it.
+    """
+    def count(column, *criteria):
+        return select(func.count(column)).where(*criteria).scalar_subquery()
+
+    async with AsyncSessionLocal() as db:
+        row = (await db.execute(
+            select(
+                count(Provider.id).label("total_providers"),
+                count(Provider.id, Provider.enabled == True).label("active_providers"),
+                count(Channel.id).label("total_channels"),
+                count(VODMovie.id).label("total_movies"),
+                count(VODSeries.id).label("total_series"),
+            )
+        )).one()
+
     return {
-        "total_providers": total_providers or 0,
-        "active_providers": active_providers or 0,
-        "total_channels": total_channels or 0,
-        "total_vod_items": total_vod_items,
-        "total_vod_movies": total_movies or 0,
-        "total_vod_series": total_series or 0,
+        "total_providers": row.total_providers,
+        "active_providers": row.active_providers,
+        "total_channels": row.total_channels,
+        "total_vod_items": row.total_movies + row.total_series,
+        "total_vod_movies": row.total_movies,
+        "total_vod_series": row.total_series,
     }
 
 
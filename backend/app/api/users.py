@@ -1,12 +1,15 @@
 """User management API endpoints."""
+from datetime import datetime
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from pydantic import BaseModel, EmailStr
+from sqlalchemy import select, func, exists
+from pydantic import BaseModel, EmailStr, field_serializer
+from app.core.cache import CacheManager, USER_STATS_KEY, conditional_json_response
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.auth import get_current_user, require_admin
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 from app.models.user import User, UserRole
 
 router = APIRouter()
@@ -38,12 +41,21 @@ class UserResponse(BaseModel):
     full_name: Optional[str]
     role: UserRole
     is_active: bool
-    created_at: str
-    last_login: Optional[str]
+    created_at: datetime
+    last_login: Optional[datetime]
 
     class Config:
         from_attributes = True
 
+    @field_serializer("created_at", "last_login")
+    def _isoformat(self, value: Optional[datetime]) -> Optional[str]:
+        # Keep the wire format clients already parse: isoformat()'s "+00:00", not pydantic's "Z"
+        return value.isoformat() if value is not None else None
+
+
+# Only the columns UserResponse needs; keeps hashed_password out of list queries
+_USER_COLUMNS = tuple(getattr(User, name) for name in UserResponse.model_fields)
+
 
 class UserStats(BaseModel):
     """User statistics."""
@@ -53,55 +65,32 @@ class UserStats(BaseModel):
 
 
 # Endpoints
-@router.get("/me", response_model=UserResponse)
+@router.get("/me", response_model=UserResponse, response_model_exclude_none=True)
 async def get_current_user_info(
     current_user: User = Depends(get_current_user)
 ):
     """Get current user information."""
-    return UserResponse(
-        id=current_user.id,
-        username=current_user.username,
-        email=current_user.email,
-        full_name=current_user.full_name,
-        role=current_user.role,
-        is_active=current_user.is_active,
-        created_at=current_user.created_at.isoformat(),
-        last_login=current_user.last_login.isoformat() if current_user.last_login else None
-    )
+    return current_user
 
 
-@router.get("/", response_model=List[UserResponse])
+@router.get("/", response_model=List[UserResponse], response_model_exclude_none=True)
 async def list_users(
     db: AsyncSession = Depends(get_db),
     admin_user: User = Depends(require_admin)
 ):
     """List all users (admin only)."""
     result = await db.execute(
-        select(User).order_by(User.created_at.desc())
+        select(*_USER_COLUMNS).order_by(User.created_at.desc())
     )
-    users = result.scalars().all()
-
-    return [
-        UserResponse(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            full_name=user.full_name,
-            role=user.role,
-            is_active=user.is_active,
-            created_at=user.created_at.isoformat(),
-            last_login=user.last_login.isoformat() if user.last_login else None
-        )
-        for user in users
-    ]
+    return result.all()
 
 
-@router.get("/stats", response_model=UserStats)
-async def get_user_stats(
-    db: AsyncSession = Depends(get_db),
-    admin_user: User = Depends(require_admin)
-):
-    """Get user statistics (admin only)."""
+async def _compute_user_stats(db: AsyncSession) -> bytes:
+    """Serialized user stats from Redis, falling back to the database."""
+    cached = await CacheManager.get_raw(USER_STATS_KEY)
+    if cached is not None:
+        return cached
+
     total = await db.scalar(select(func.count(User.id)))
     admin_count = await db.scalar(
         select(func.count(User.id)).where(User.role == UserRole.ADMIN)
@@ -110,14 +99,27 @@ async def get_user_stats(
         select(func.count(User.id)).where(User.is_active.is_(True))
     )
 
-    return UserStats(
+    stats = UserStats(
         total_users=total or 0,
         admin_users=admin_count or 0,
         active_users=active or 0
     )
+    return await CacheManager.set(USER_STATS_KEY, stats.model_dump(), ttl=settings.STATS_CACHE_TTL)
 
 
-@router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+@router.get("/stats", response_model=UserStats)
+async def get_user_stats(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    admin_user: User = Depends(require_admin)
+):
+    """Get user statistics (admin only)."""
+    # Redis only: user changes on any API worker invalidate it there
+    payload = await _compute_user_stats(db)
+    return conditional_json_response(request, payload, settings.STATS_CACHE_TTL, private=True)
+
+
+@router.post("/", response_model=UserResponse, response_model_exclude_none=True, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_data: UserCreate,
     db: AsyncSession = Depends(get_db),
@@ -126,7 +128,7 @@ async def create_user(
     """Create a new user (admin only)."""
     # Check if username already exists
     existing = await db.scalar(
-        select(User).where(User.username == user_data.username)
+        select(exists().where(User.username == user_data.username))
     )
     if existing:
         raise HTTPException(
@@ -137,7 +139,7 @@ async def create_user(
     # Check if email already exists (if provided)
     if user_data.email:
         existing_email = await db.scalar(
-            select(User).where(User.email == user_data.email)
+            select(exists().where(User.email == user_data.email))
         )
         if existing_email:
             raise HTTPException(
@@ -149,7 +151,7 @@ async def create_user(
     new_user = User(
         username=user_data.username,
         email=user_data.email,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=await get_password_hash_async(user_data.password),
         full_name=user_data.full_name,
         role=user_data.role,
         is_active=True
@@ -158,20 +160,12 @@ async def create_user(
     db.add(new_user)
     await db.commit()
     await db.refresh(new_user)
+    await CacheManager.invalidate_user_cache()
 
-    return UserResponse(
-        id=new_user.id,
-        username=new_user.username,
-        email=new_user.email,
-        full_name=new_user.full_name,
-        role=new_user.role,
-        is_active=new_user.is_active,
-        created_at=new_user.created_at.isoformat(),
-        last_login=None
-    )
+    return new_user
 
 
-@router.patch("/{user_id}", response_model=UserResponse)
+@router.patch("/{user_id}", response_model=UserResponse, response_model_exclude_none=True)
 async def update_user(
     user_id: int,
     user_data: UserUpdate,
@@ -200,10 +194,10 @@ async def update_user(
     if user_data.email is not None:
         # Check if email is already in use by another user
         existing_email = await db.scalar(
-            select(User).where(
+            select(exists().where(
                 User.email == user_data.email,
                 User.id != user_id
-            )
+            ))
         )
         if existing_email:
             raise HTTPException(
@@ -226,17 +220,9 @@ async def update_user(
 
     await db.commit()
     await db.refresh(user)
+    await CacheManager.invalidate_user_cache()
 
-    return UserResponse(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        full_name=user.full_name,
-        role=user.role,
-        is_active=user.is_active,
-        created_at=user.created_at.isoformat(),
-        last_login=user.last_login.isoformat() if user.last_login else None
-    )
+    return user
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -265,5 +251,6 @@ async def delete_user(
 
     await db.delete(user)
     await db.commit()
+    await CacheManager.invalidate_user_cache()
 
     return None
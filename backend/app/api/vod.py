@@ -1,13 +1,19 @@
 """VOD API endpoints."""
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from urllib.parse import urlencode
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, tuple_
 from pydantic import BaseModel
-from app.core.database import get_db
+from app.core.cache import (
+    CacheManager, VOD_LIST_PREFIX, VOD_STATS_KEY, VOD_VERSION_KEY, local_cache, conditional_json_response
+)
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, get_db
 from app.models.vod import VODMovie, VODSeries, VODEpisode
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class MovieResponse(BaseModel):
@@ -37,44 +43,87 @@ class SeriesResponse(BaseModel):
         from_attributes = True
 
 
-@router.get("/movies", response_model=List[MovieResponse])
+# Column projections matching the response models, so list queries skip
+# plot/cast/provider_metadata and ORM hydration
+_MOVIE_COLUMNS = tuple(getattr(VODMovie, name) for name in MovieResponse.model_fields)
+_SERIES_COLUMNS = tuple(getattr(VODSeries, name) for name in SeriesResponse.model_fields)
+
+
+def _paginate(query, model, skip: int, limit: int, after_title: Optional[str], after_id: Optional[int]):
+    """Order by (title, id) and page by keyset when a cursor is given, else by offset."""
+    if after_title is not None and after_id is not None:
+        query = query.where(tuple_(model.title, model.id) > (after_title, after_id))
+    elif skip:
+        query = query.offset(skip)
+    return query.order_by(model.title, model.id).limit(limit)
+
+
+def _set_next_cursor(response: Response, rows, limit: int) -> None:
+    """Expose the keyset cursor for the next page as ready-to-append query params."""
+    if len(rows) == limit:
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = urlencode({"after_title": last.title, "after_id": last.id})
+
+
+@router.get("/movies", response_model=List[MovieResponse], response_model_exclude_none=True)
 async def list_movies(
+    response: Response,
     genre: Optional[str] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: AsyncSession = Depends(get_db)
+    after_title: Optional[str] = None,
+    after_id: Optional[int] = None
 ):
-    """List VOD movies."""
-    query = select(VODMovie).where(VODMovie.is_active.is_(True))
+    """List VOD movies.
 
-    if genre:
-        query = query.where(VODMovie.genre == genre)
+    Pass ``after_title``/``after_id`` (from the ``X-Next-Cursor`` header) instead of
+    ``skip`` to page by index seek rather than scanning past skipped rows.
+    """
+    async def fetch():
+        # Coalesced waiters share this loader, so it must not use any one request's session
+        query = select(*_MOVIE_COLUMNS).where(VODMovie.is_active.is_(True))
 
-    query = query.offset(skip).limit(limit).order_by(VODMovie.title)
+        if genre:
+            query = query.where(VODMovie.genre == genre)
 
-    result = await db.execute(query)
-    movies = result.scalars().all()
+        query = _paginate(query, VODMovie, skip, limit, after_title, after_id)
+
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(query)).all()
+        return [MovieResponse.model_validate(row) for row in rows]
+
+    version = await CacheManager.cached_version(VOD_VERSION_KEY)
+    cache_key = f"{VOD_LIST_PREFIX}{version}:{genre}:{skip}:{limit}:{after_title}:{after_id}"
+    movies = await local_cache.get_or_compute(cache_key, fetch, ttl=settings.VOD_LIST_CACHE_TTL)
+    _set_next_cursor(response, movies, limit)
 
     return movies
 
 
 @router.get("/series", response_model=List[SeriesResponse])
 async def list_series(
+    response: Response,
     genre: Optional[str] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_title: Optional[str] = None,
+    after_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
 ):
-    """List VOD series."""
-    query = select(VODSeries).where(VODSeries.is_active.is_(True))
+    """List VOD series.
+
+    Supports the same ``after_title``/``after_id`` keyset cursor as ``/movies``.
+    """
+    query = select(*_SERIES_COLUMNS).where(VODSeries.is_active.is_(True))
 
     if genre:
         query = query.where(VODSeries.genre == genre)
 
-    query = query.offset(skip).limit(limit).order_by(VODSeries.title)
+    query = _paginate(query, VODSeries, skip, limit, after_title, after_id)
 
     result = await db.execute(query)
-    series = result.scalars().all()
+    series = result.all()
+    _set_next_cursor(response, series, limit)
 
     return series
 
@@ -90,15 +139,27 @@ async def generate_strm_files(db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Failed to queue STRM generation: {str(e)}")
 
 
-@router.get("/stats")
-async def get_vod_stats(db: AsyncSession = Depends(get_db)):
-    """Get VOD statistics."""
+async def _compute_vod_stats(db: AsyncSession) -> bytes:
+    """Serialized VOD stats from Redis, falling back to the database."""
+    cached = await CacheManager.get_raw(VOD_STATS_KEY)
+    if cached is not None:
+        return cached
+
     movie_count = await db.scalar(select(func.count(VODMovie.id)).where(VODMovie.is_active.is_(True)))
     series_count = await db.scalar(select(func.count(VODSeries.id)).where(VODSeries.is_active.is_(True)))
     episode_count = await db.scalar(select(func.count(VODEpisode.id)).where(VODEpisode.is_active.is_(True)))
 
-    return {
+    stats = {
         "total_movies": movie_count or 0,
         "total_series": series_count or 0,
         "total_episodes": episode_count or 0
     }
+    return await CacheManager.set(VOD_STATS_KEY, stats, ttl=settings.STATS_CACHE_TTL)
+
+
+@router.get("/stats")
+async def get_vod_stats(request: Request, db: AsyncSession = Depends(get_db)):
+    """Get VOD statistics."""
+    # Redis only: the VOD sync worker invalidates it, and can't reach this process's memory
+    payload = await _compute_vod_stats(db)
+    return conditional_json_response(request, payload, settings.STATS_CACHE_TTL)
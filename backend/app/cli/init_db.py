@@ -1,79 +1,67 @@
 """Database initialization CLI."""
 import asyncio
-import sys
-from sqlalchemy import select
+from sqlalchemy import select, exists
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.settings import DEFAULT_SETTINGS
 from app.core.database import get_session_factory
 from app.core.security import get_password_hash
 from app.models.user import User
-from app.models.settings import Settings
+from app.models.settings import AppSettings
 
 
-async def create_admin_user():
+async def create_admin_user(db: AsyncSession):
     """Create initial admin user."""
-    session_factory = get_session_factory()
-    async with session_factory() as db:
-        # Check if admin exists
-        result = await db.execute(
-            select(User).where(User.username == "admin")
-        )
-        admin = result.scalar_one_or_none()
-
-        if admin:
-            print("Admin user already exists!")
-            return
+    # Check if admin exists
+    if await db.scalar(select(exists().where(User.username == "admin"))):
+        print("Admin user already exists!")
+        return
 
-        # Create admin user
-        admin = User(
-            username="admin",
-            email="admin@localhost",
-            hashed_password=get_password_hash("admin"),
-            is_active=True,
-            is_superuser=True
-        )
-        db.add(admin)
-        await db.commit()
+    # Create admin user
+    db.add(User(
+        username="admin",
+        email="admin@localhost",
+        hashed_password=get_password_hash("admin"),
+        role='admin',
+        is_active=True,
+        is_superuser=True
+    ))
 
-        print("✓ Admin user created successfully!")
-        print("  Username: admin")
-        print("  Password: admin")
-        print("  Please change the password after first login!")
+    print("✓ Admin user created successfully!")
+    print("  Username: admin")
+    print("  Password: admin")
+    print("  Please change the password after first login!")
 
 
-async def create_default_settings():
-    """Create default app settings."""
-    session_factory = get_session_factory()
-    async with session_factory() as db:
-        # Check if settings exist
-        result = await db.execute(select(Settings))
-        existing = result.scalar_one_or_none()
+async def create_default_settings(db: AsyncSession):
+    """Create default app settings that are not stored yet."""
+    # One query for the keys already present instead of one per setting
+    existing = set((await db.execute(select(AppSettings.key))).scalars())
+    missing = [key for key in DEFAULT_SETTINGS if key not in existing]
 
-        if existing:
-            print("Settings already exist!")
-            return
+    if not missing:
+        print("Settings already exist!")
+        return
 
-        # Create default settings
-        settings = Settings(
-            fuzzy_threshold=85,
-            health_check_enabled=True,
-            health_check_timeout=10,
-            health_check_schedule="0 3 * * *",  # 3 AM daily
-            sync_schedule="0 * * * *",  # Every hour
-            epg_schedule="0 2 * * *",  # 2 AM daily
-            enable_hdhr=True,
-            hdhr_device_id="IPTV-MGR",
-            hdhr_tuner_count=4
+    db.add_all([
+        AppSettings(
+            key=key,
+            value=DEFAULT_SETTINGS[key]["value"],
+            value_type=DEFAULT_SETTINGS[key]["type"],
+            description=DEFAULT_SETTINGS[key]["description"]
         )
-        db.add(settings)
-        await db.commit()
+        for key in missing
+    ])
 
-        print("✓ Default settings created successfully!")
+    print(f"✓ Created {len(missing)} default settings!")
 
 
 async def init_database():
-    """Initialize database with default data."""
+    """Initialize database with default data in a single transaction."""
     print("Initializing database...")
-    await create_admin_user()
-    await create_default_settings()
+    session_factory = get_session_factory()
+    async with session_factory() as db, db.begin():
+        await create_admin_user(db)
+        await create_default_settings(db)
     print("\n✓ Database initialization complete!")
 
 
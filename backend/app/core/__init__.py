@@ -1,7 +1,3 @@
 """Core module."""
 
-from .config import settings
-
-__all__ = ["settings"]
-
 # make 'app.core' a package explicitly
@@ -0,0 +1,222 @@
+"""Response caching: an in-process TTL cache in front of Redis."""
+import asyncio
+import hashlib
+import logging
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import orjson
+import redis.asyncio as redis
+from fastapi import Request, Response
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Cache keys
+USER_STATS_KEY = "stats:users"
+VOD_STATS_KEY = "stats:vod"
+SYSTEM_STATS_KEY = "stats:system"  # in-process only
+VOD_LIST_PREFIX = "vod:movies:"  # in-process only, keyed by VOD_VERSION_KEY
+VOD_VERSION_KEY = "cache:vod:version"  # bumped on every VOD invalidation, from any process
+VERSION_CHECK_INTERVAL = 5  # seconds an in-process copy of a version counter is trusted
+CHANNEL_CATEGORIES_KEY = "cache:channels:categories"
+HDHR_LINEUP_PREFIX = "cache:hdhr:lineup:"
+LINEUP_VERSION_KEY = "cache:hdhr:lineup:version"  # bumped on every channel invalidation
+
+# redis.asyncio connections are bound to the loop that opened them, and Celery
+# tasks each run on a fresh loop, so keep one client per running loop.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, redis.Redis]" = weakref.WeakKeyDictionary()
+
+
+class AsyncTTLCache:
+    """In-process TTL cache that coalesces concurrent misses.
+
+    While a value is being computed, other callers for the same key await
+    the same loader task instead of each hitting the database. The loader
+    runs as its own task, so a caller that is cancelled stops waiting without
+    cancelling it for the rest. Intended for the API process, which runs a
+    single event loop; values written by Celery workers belong in Redis,
+    since invalidations here only reach the calling process.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    async def get_or_compute(self, key: str, factory: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, factory, ttl))
+            # Every waiter may have been cancelled; don't leave the error unretrieved
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._pending[key] = task
+        return await asyncio.shield(task)
+
+    async def _load(self, key: str, factory: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        try:
+            value = await factory()
+        finally:
+            self._pending.pop(key, None)
+        self._store(key, value, ttl)
+        return value
+
+    def _store(self, key: str, value: Any, ttl: float) -> None:
+        if len(self._entries) >= self.maxsize:
+            now = time.monotonic()
+            for k in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+                del self._entries[k]
+            if len(self._entries) >= self.maxsize:
+                # Still full: drop the oldest insertion
+                self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def invalidate(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+
+
+local_cache = AsyncTTLCache()
+
+
+def get_redis() -> redis.Redis:
+    """Return the Redis client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=False)
+        _clients[loop] = client
+    return client
+
+
+def conditional_json_response(request: Request, payload: bytes, max_age: int,
+                              private: bool = False) -> Response:
+    """Serve pre-serialized JSON with an ETag and Cache-Control.
+
+    Clients (and reverse proxies, unless ``private``) revalidate with
+    If-None-Match and get an empty 304 when their copy is current.
+    """
+    etag = f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"{'private' if private else 'public'}, max-age={max_age}",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+class CacheManager:
+    """Thin JSON cache over Redis.
+
+    Cache failures are logged and treated as misses so an unavailable Redis
+    only costs the uncached code path, never the request.
+    """
+
+    @staticmethod
+    async def get_raw(key: str) -> Optional[bytes]:
+        """Get the serialized JSON bytes stored under ``key``."""
+        try:
+            return await get_redis().get(key)
+        except (redis.RedisError, OSError) as e:
+            logger.warning(f"Cache get failed for {key}: {e}")
+            return None
+
+    @staticmethod
+    async def get(key: str) -> Any:
+        """Get and decode the value stored under ``key``."""
+        raw = await CacheManager.get_raw(key)
+        return orjson.loads(raw) if raw is not None else None
+
+    @staticmethod
+    async def set(key: str, value: Any, ttl: int = 60) -> bytes:
+        """Serialize and store ``value`` for ``ttl`` seconds; returns the JSON bytes."""
+        payload = orjson.dumps(value)
+        try:
+            await get_redis().set(key, payload, ex=ttl)
+        except (redis.RedisError, OSError) as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+        return payload
+
+    @staticmethod
+    async def delete(*keys: str) -> None:
+        """Invalidate one or more keys."""
+        if not keys:
+            return
+        local_cache.invalidate(*keys)
+        try:
+            await get_redis().delete(*keys)
+        except (redis.RedisError, OSError) as e:
+            logger.warning(f"Cache delete failed for {keys}: {e}")
+
+    @staticmethod
+    async def invalidate_user_cache() -> None:
+        await CacheManager.delete(USER_STATS_KEY)
+
+    @staticmethod
+    async def version(key: str) -> Optional[str]:
+        """Current value of a version counter; None if Redis is unavailable.
+
+        A missing counter (new or flushed Redis) is seeded from the clock, so
+        it never comes back with a value an earlier version already used.
+        """
+        client = get_redis()
+        try:
+            raw = await client.get(key)
+            if raw is None:
+                # NX: if another process seeded it first, read back its value
+                await client.set(key, time.time_ns(), nx=True)
+                raw = await client.get(key)
+        except (redis.RedisError, OSError) as e:
+            logger.warning(f"Cache version read failed for {key}: {e}")
+            return None
+        return raw.decode() if raw is not None else None
+
+    @staticmethod
+    async def cached_version(key: str) -> Optional[str]:
+        """version(), remembered in process for VERSION_CHECK_INTERVAL seconds.
+
+        Keeps Redis off the hit path of in-process caches; an unreachable
+        Redis is retried (and logged) at most once per interval.
+        """
+        return await local_cache.get_or_compute(
+            f"version:{key}", lambda: CacheManager.version(key), ttl=VERSION_CHECK_INTERVAL
+        )
+
+    @staticmethod
+    async def bump_version(key: str) -> None:
+        """Advance a version counter so every key derived from it changes."""
+        try:
+            await get_redis().incr(key)
+        except (redis.RedisError, OSError) as e:
+            logger.warning(f"Cache version bump failed for {key}: {e}")
+
+    @staticmethod
+    async def invalidate_channel_cache() -> None:
+        """Drop channel categories and move the HDHomeRun lineup to a new ETag.
+
+        Call after committing any change to channels or their streams.
+        """
+        await CacheManager.delete(CHANNEL_CATEGORIES_KEY)
+        await CacheManager.bump_version(LINEUP_VERSION_KEY)
+
+    @staticmethod
+    async def invalidate_vod_cache() -> None:
+        """Drop VOD stats and retire every process's cached movie pages.
+
+        Celery workers call this after a sync and cannot reach the API's
+        local cache, so bumping the shared version changes the page keys.
+        """
+        local_cache.invalidate_prefix(VOD_LIST_PREFIX)
+        await CacheManager.delete(VOD_STATS_KEY)
+        await CacheManager.bump_version(VOD_VERSION_KEY)
@@ -1,25 +1,31 @@
 """Application configuration."""
 from __future__ import annotations
-import os, json, secrets
+import os, secrets
+from functools import lru_cache
 from pathlib import Path
-from typing import List
-from pydantic import field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Annotated, List
+from urllib.parse import urlsplit
+from dotenv import dotenv_values
+from pydantic import BeforeValidator, Field, TypeAdapter, ValidationError, ValidationInfo, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 def generate_secret_key() -> str:
     """Generate a secure secret key."""
     return secrets.token_urlsafe(32)
 
+ENV_FILE = Path("/app/data/.env")
+
 def _ensure_env() -> None:
-    env_file = Path("/app/data/.env")
+    env_file = ENV_FILE
     if env_file.exists():
         return
-    db_user = os.getenv("POSTGRES_USER", "iptv_user")
-    db_pass = os.getenv("POSTGRES_PASSWORD", "iptv_secure_pass_change_me")
-    db_name = os.getenv("POSTGRES_DB", "iptv_db")
-    db_host = os.getenv("POSTGRES_HOST", "db")
-    db_port = os.getenv("POSTGRES_PORT", "5432")
-    backend_port = os.getenv("BACKEND_PORT", "8000")
+    env = dict(os.environ)  # one snapshot instead of an os.environ decode per lookup
+    db_user = env.get("POSTGRES_USER", "iptv_user")
+    db_pass = env.get("POSTGRES_PASSWORD", "iptv_secure_pass_change_me")
+    db_name = env.get("POSTGRES_DB", "iptv_db")
+    db_host = env.get("POSTGRES_HOST", "db")
+    db_port = env.get("POSTGRES_PORT", "5432")
+    backend_port = env.get("BACKEND_PORT", "8000")
     database_url = f"postgresql+asyncpg://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}"
     env_file.parent.mkdir(parents=True, exist_ok=True)
     env_file.write_text(f"""SECRET_KEY={generate_secret_key()}
@@ -39,16 +45,53 @@ DB_POOL_SIZE=20
 DB_MAX_OVERFLOW=40
 DB_POOL_TIMEOUT=10
 DB_POOL_RECYCLE=1800
+DB_STATEMENT_CACHE_SIZE=1024
+DB_PREPARED_STATEMENT_CACHE_SIZE=500
 DB_ECHO=false
 """)
 
+def _load_env_file(env_file: Path = ENV_FILE) -> None:
+    """Overlay the variables in ``env_file`` onto os.environ, once.
+
+    Parsed with python-dotenv, as pydantic-settings did, so comments, ``export``
+    prefixes, quoting and ``${VAR}`` expansion behave the same. Real environment
+    variables keep precedence (setdefault), so Settings only reads os.environ.
+    """
+    if not env_file.is_file():
+        return
+    for key, value in dotenv_values(env_file, encoding="utf-8").items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+
+_DEFAULT_ORIGINS = ["http://localhost:8000","http://127.0.0.1:8000","http://localhost:3001"]
+_ORIGINS_JSON = TypeAdapter(List[str])
+
+def _parse_origins(v):
+    """Accept ALLOWED_ORIGINS as a JSON array or a comma-separated string."""
+    if isinstance(v, list):
+        return v
+    if isinstance(v, str):
+        v = v.strip()
+        if v.startswith("["):
+            # Parse and validate in one pass in pydantic-core
+            try:
+                return _ORIGINS_JSON.validate_json(v)
+            except ValidationError:
+                pass
+        if v:
+            return [x.strip() for x in v.split(",") if x.strip()]
+    return list(_DEFAULT_ORIGINS)
+
 class Settings(BaseSettings):
-    model_config = SettingsConfigDict(env_file="/app/data/.env", env_file_encoding="utf-8", extra="ignore")
+    # The .env file is folded into os.environ by get_settings(), not re-read here
+    # Frozen: settings are read on every request but never mutated at runtime
+    # Case-sensitive: fields are upper-case env names, matched by exact lookup
+    model_config = SettingsConfigDict(env_file=None, extra="ignore", frozen=True, case_sensitive=True)
 
     # App
     APP_NAME: str = "IPTV Stream Manager"
     APP_VERSION: str = "0.1.0"
-    SECRET_KEY: str = generate_secret_key()
+    SECRET_KEY: str = Field(default_factory=generate_secret_key)  # only generated when not configured
 
     # Logging
     LOG_FILE: str = "/app/data/logs/app.log"
@@ -60,41 +103,53 @@ class Settings(BaseSettings):
     DB_MAX_OVERFLOW: int = 40
     DB_POOL_TIMEOUT: int = 10
     DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False  # enable if the database sits behind something that drops idle connections
+    DB_STATEMENT_CACHE_SIZE: int = 1024  # asyncpg prepared statements cached per connection
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500  # SQLAlchemy asyncpg adapter cache per connection
     DB_ECHO: bool = False
+    DB_QUERY_CACHE_SIZE: int = 1200  # SQLAlchemy compiled-statement cache entries
 
     # Redis & Celery
     REDIS_URL: str = "redis://redis:6379/0"
     CELERY_BROKER_URL: str = "redis://redis:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://redis:6379/0"
+    # Empty means REDIS_URL's server with database 1, so the counters follow REDIS_URL
+    RATE_LIMIT_STORAGE_URL: str = Field(default="", validate_default=True)
 
     # Server
     DEBUG: bool = False
     BACKEND_PORT: int = 8000
     FRONTEND_PORT: int = 3001
-    ALLOWED_ORIGINS: List[str] = ["http://localhost:8000","http://127.0.0.1:8000","http://localhost:3001"]
+    # NoDecode hands the raw env string to _parse_origins instead of json.loads-ing it first
+    ALLOWED_ORIGINS: Annotated[List[str], NoDecode, BeforeValidator(_parse_origins)] = _DEFAULT_ORIGINS
 
     OUTPUT_DIR: str = "/app/output"
     DEFAULT_FUZZY_THRESHOLD: float = 0.85
     DEFAULT_QUALITY_PREFERENCE: str = "best"
+    STATS_CACHE_TTL: int = 10  # seconds; stats endpoints are polled by dashboards
+    VOD_LIST_CACHE_TTL: int = 30  # seconds; in-process cache of movie list pages
 
-    @field_validator("ALLOWED_ORIGINS", mode="before")
+    @field_validator("RATE_LIMIT_STORAGE_URL")
     @classmethod
-    def parse_origins(cls, v):
-        if isinstance(v, list):
+    def _default_rate_limit_storage(cls, v: str, info: ValidationInfo) -> str:
+        if v:
             return v
-        if isinstance(v, str):
-            v = v.strip()
-            if v.startswith("["):
-                try:
-                    return json.loads(v)
-                except Exception:
-                    pass
-            if v:
-                return [x.strip() for x in v.split(",") if x.strip()]
-        return ["http://localhost:8000","http://127.0.0.1:8000","http://localhost:3001"]
-
-_ensure_env()
-settings = Settings()
+        return urlsplit(info.data.get("REDIS_URL", ""))._replace(path="/1").geturl()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the application settings once per process.
+
+    The first call bootstraps /app/data/.env unless ENSURE_ENV_FILE is
+    disabled (e.g. for CLI tools or workers that must not write it).
+    """
+    if os.getenv("ENSURE_ENV_FILE", "true").lower() not in ("0", "false", "no"):
+        _ensure_env()
+    _load_env_file()
+    return Settings()
+
+# Module-level instance kept for existing `from app.core.config import settings` callers
+settings = get_settings()
 
 # Export both settings and the function
-__all__ = ["settings", "Settings", "generate_secret_key"]
\ No newline at end of file
+__all__ = ["settings", "Settings", "get_settings", "generate_secret_key"]
\ No newline at end of file
@@ -1,19 +1,41 @@
 """Database configuration and session management."""
 import os
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
-from app.core.config import settings
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import NullPool
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Celery tasks each run on a fresh event loop and asyncpg connections cannot
+# outlive the loop that opened them, so worker processes (CELERY_WORKER=1)
+# open a connection per session instead of pooling.
+if os.getenv("CELERY_WORKER", "").lower() in ("1", "true", "yes"):
+    pool_options = {"poolclass": NullPool}
+else:
+    pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        # No SELECT 1 per checkout; pool_recycle retires connections before server/NAT timeouts
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        # Reuse the most recently returned connection so idle extras age out under pool_recycle
+        "pool_use_lifo": True,
+    }
 
 # Create async engine with optimized pool settings
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DB_ECHO,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_timeout=settings.DB_POOL_TIMEOUT,
-    pool_recycle=settings.DB_POOL_RECYCLE,
-    pool_pre_ping=True,
+    # Room for every distinct statement shape the app and tasks issue, so none is recompiled
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    **pool_options,
     connect_args={
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        # SQLAlchemy's adapter-level cache of asyncpg prepared statements
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
         "server_settings": {
             "application_name": "iptv_manager",
             "statement_timeout": "30000",  # 30 second query timeout
@@ -28,17 +50,12 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
-# Create declarative base
-Base = declarative_base()
+# Declarative base (SQLAlchemy 2.0 style; Column-based models map unchanged)
+class Base(DeclarativeBase):
+    pass
 
 # Export async_session for use in main.py
-from sqlalchemy.ext.asyncio import async_sessionmaker
-
-async_session = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+async_session = AsyncSessionLocal
 
 
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
@@ -50,12 +67,42 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
     return AsyncSessionLocal
 
 
+def get_pool_status() -> dict:
+    """Snapshot of connection pool usage, for tuning DB_POOL_* under real traffic."""
+    pool = engine.pool
+    return {
+        "status": pool.status(),
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement(orm_execute_state):
+    # UPDATE/DELETE/INSERT or raw SQL issued through session.execute
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["has_writes"] = True
+
+
 async def get_db():
-    """Dependency for getting async database sessions."""
+    """Dependency for getting async database sessions.
+
+    Commits only when the request wrote something; read-only requests just
+    close the session and let the pool reset the connection.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            if session.info.get("has_writes") or session.new or session.dirty or session.deleted:
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -63,6 +110,18 @@ async def get_db():
             await session.close()
 
 
+async def get_db_readonly():
+    """Dependency for read-only endpoints.
+
+    A bare AsyncSession outside the sessionmaker; nothing is ever committed,
+    and the transaction is rolled back on close. The session only checks out
+    a pooled connection at its first query, so endpoints answered from Redis
+    (lineup 304s, cached categories) never touch the pool.
+    """
+    async with AsyncSession(engine, expire_on_commit=False, autoflush=False) as session:
+        yield session
+
+
 async def init_db():
     """Initialize database.
 
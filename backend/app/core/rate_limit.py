@@ -0,0 +1,14 @@
+"""Shared rate limiter."""
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from app.core.config import settings
+
+# Counters live in Redis so every API worker enforces the same budget; if Redis
+# is unreachable the limiter falls back to per-process memory instead of failing
+limiter = Limiter(
+    key_func=get_remote_address,
+    default_limits=["100 per minute"],
+    storage_uri=settings.RATE_LIMIT_STORAGE_URL,
+    in_memory_fallback_enabled=True,
+)
@@ -1,10 +1,16 @@
 """Security utilities for authentication."""
+import asyncio
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from passlib.hash import argon2
 from app.core.config import settings
 
+# Require the native argon2-cffi binding; fail at import rather than silently
+# falling back to the pure-Python argon2pure backend
+argon2.set_backend("argon2_cffi")
+
 # Password hashing - using argon2 for modern security
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
@@ -23,6 +29,12 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in the default executor so the event loop keeps serving requests."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -1,20 +1,24 @@
 """Main FastAPI application."""
 
+import asyncio
 import logging
+import logging.handlers
 import os
+import queue
 from pathlib import Path
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, HTTPException
+import orjson
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
+from fastapi.responses import FileResponse, ORJSONResponse, Response
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
-from app.core.config import settings  # instance
+from app.core.config import get_settings
 from app.core.database import init_db, close_db
+from app.core.rate_limit import limiter
 from app.api import (
     providers,
     channels,
@@ -31,26 +35,91 @@ from app.api import (
     merge,
     streams as streams_api,
 )
-from passlib.context import CryptContext
-from sqlalchemy import select
+from sqlalchemy import exists, select
 
-# Configure logging - ensure log directory exists BEFORE creating FileHandler
-log_file = Path(settings.LOG_FILE)
-log_file.parent.mkdir(parents=True, exist_ok=True)
+settings = get_settings()
+
+# Configure logging - callers only enqueue records; a listener thread started in
+# lifespan formats them and does the file/console I/O off the event loop.
+log_queue = queue.SimpleQueue()
 
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler(settings.LOG_FILE), logging.StreamHandler()],
+    handlers=[logging.handlers.QueueHandler(log_queue)],
 )
 logger = logging.getLogger(__name__)
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address, default_limits=["100 per minute"])
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 30  # seconds
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through a large buffer.
+
+    Records are flushed immediately only at ERROR and above; everything else
+    reaches disk when the buffer fills or on the periodic flush in lifespan.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+async def flush_logs_periodically(handler: logging.Handler, interval: float = LOG_FLUSH_INTERVAL):
+    """Flush ``handler`` every ``interval`` seconds, off the event loop."""
+    while True:
+        await asyncio.sleep(interval)
+        await asyncio.to_thread(handler.flush)
+
+
+def start_log_listener() -> logging.handlers.QueueListener:
+    """Attach the file and console handlers to the log queue and start draining it."""
+    # Ensure log directory exists BEFORE creating FileHandler
+    log_file = Path(settings.LOG_FILE)
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handlers = [BufferedFileHandler(log_file), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+class FrozenOriginCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware whose origin allow-list is a frozenset (O(1) membership per request)."""
+
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for Vite's content-hashed bundles, cached by browsers for a year."""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    log_listener = start_log_listener()
+    log_flusher = asyncio.create_task(flush_logs_periodically(log_listener.handlers[0]))
     logger.info("Starting IPTV Stream Manager...")
     await init_db()
     logger.info("Database initialized")
@@ -59,8 +128,6 @@ async def lifespan(app: FastAPI):
     from app.core.database import async_session
     from app.models.user import User, UserRole
     import os
-    # Password hashing - using argon2 for modern security
-    pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
     # Get admin password from environment or use default (with warning)
     default_admin_password = os.getenv("DEFAULT_ADMIN_PASSWORD", "admin123")
@@ -68,13 +135,17 @@ async def lifespan(app: FastAPI):
         logger.warning("⚠️  Using default admin password! Set DEFAULT_ADMIN_PASSWORD environment variable for production!")
 
     async with async_session() as db:
-        result = await db.execute(select(User).where(User.username == "admin"))
-        admin = result.scalar_one_or_none()
-        if not admin:
+        # EXISTS: no need to load the row (and its password hash) just to check
+        admin_exists = await db.scalar(select(exists().where(User.username == "admin")))
+        if not admin_exists:
+            # Only the first boot needs a hash; later restarts never load argon2 here
+            from app.core.security import get_password_hash_async
+
             admin = User(
                 username="admin",
                 email="admin@example.com",
-                hashed_password=pwd_context.hash(default_admin_password),
+                # argon2 is CPU-bound; hash in the executor so startup probes are still served
+                hashed_password=await get_password_hash_async(default_admin_password),
                 role='admin',  # Use string directly - model handles enum conversion
                 is_active=True,
                 is_superuser=True
@@ -90,84 +161,101 @@ async def lifespan(app: FastAPI):
     yield
     logger.info("Shutting down...")
     await close_db()
+    log_flusher.cancel()
+    log_listener.stop()  # drains the queue
+    log_listener.handlers[0].flush()
 
 
-app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION, lifespan=lifespan)
+app = FastAPI(
+    title=settings.APP_NAME,
+    version=settings.APP_VERSION,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Add rate limiting
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 app.add_middleware(
-    CORSMiddleware,
+    FrozenOriginCORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Routers
+# Routers - Starlette tries routes in registration order, so the ones hit most
+# (HDHomeRun tuner polling, health probes, playback) go first
+app.include_router(hdhr.router, tags=["hdhr"])
 app.include_router(health.router, prefix="/api/health", tags=["health"])
-app.include_router(system.router, prefix="/api/system", tags=["system"])
-app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
-app.include_router(users.router, prefix="/api/users", tags=["users"])
-app.include_router(providers.router, prefix="/api/providers", tags=["providers"])
+app.include_router(streams_api.router)
 app.include_router(channels.router, prefix="/api/channels", tags=["channels"])
-app.include_router(vod.router, prefix="/api/vod", tags=["vod"])
 app.include_router(epg.router, prefix="/api/epg", tags=["epg"])
+app.include_router(vod.router, prefix="/api/vod", tags=["vod"])
 app.include_router(favorites.router, prefix="/api/favorites", tags=["favorites"])
-app.include_router(analytics.router, prefix="/api/analytics", tags=["analytics"])
+app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
+app.include_router(system.router, prefix="/api/system", tags=["system"])
+app.include_router(providers.router, prefix="/api/providers", tags=["providers"])
 app.include_router(merge.router, prefix="/api", tags=["merge"])
+app.include_router(users.router, prefix="/api/users", tags=["users"])
+app.include_router(analytics.router, prefix="/api/analytics", tags=["analytics"])
 app.include_router(settings_router.router, prefix="/api/settings", tags=["settings"])
-app.include_router(streams_api.router)
-app.include_router(hdhr.router, tags=["hdhr"])
+
+
+# Settings are frozen, so the static status payloads are serialized once at import
+APP_INFO = {"name": settings.APP_NAME, "version": settings.APP_VERSION, "status": "running", "docs": "/docs"}
+API_ROOT_PAYLOAD = orjson.dumps({**APP_INFO, "api_version": "v1"})
 
 
 @app.get("/api")
 async def api_root():
-    return {
-        "name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "status": "running",
-        "docs": "/docs",
-        "api_version": "v1",
-    }
+    return Response(API_ROOT_PAYLOAD, media_type="application/json")
 
 
 # Serve frontend static files - MUST BE LAST
 frontend_dist = Path("/app/frontend/dist")
+# Paths the SPA catch-all must not answer; str.startswith takes the tuple directly
+SPA_EXCLUDED_PREFIXES = ("api/", "docs", "openapi.json", "redoc")
 if frontend_dist.exists():
     logger.info(f"Frontend found at {frontend_dist}")
     assets_dir = frontend_dist / "assets"
     if assets_dir.exists():
-        app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
+        app.mount("/assets", ImmutableStaticFiles(directory=str(assets_dir)), name="assets")
+
+    # The built frontend only changes on deploy, so list its files once instead
+    # of stat()-ing the requested path on every SPA navigation
+    frontend_files = frozenset(
+        p.relative_to(frontend_dist).as_posix() for p in frontend_dist.rglob("*") if p.is_file()
+    )
+    # The SPA shell is served for every client-side route; keep its bytes in memory
+    index_html = (frontend_dist / "index.html").read_bytes() if "index.html" in frontend_files else None
+    index_headers = {"Cache-Control": "no-cache"}  # revalidate so new deploys are picked up
+    FRONTEND_NOT_FOUND = orjson.dumps({"error": "Frontend not found"})
 
     @app.get("/{full_path:path}", include_in_schema=False)
     async def serve_frontend(full_path: str):
         # Exclude API and docs from SPA catch-all so real API/doc routes handle them.
         # If a request hits this path with an excluded prefix, respond with 404.
-        excluded_prefixes = ("api/", "docs", "openapi.json", "redoc")
-        if any(full_path.startswith(prefix) for prefix in excluded_prefixes):
+        if full_path.startswith(SPA_EXCLUDED_PREFIXES):
             # Return proper 404 to avoid masking missing API endpoints with 200 JSON
-            raise HTTPException(status_code=404, detail={"error": "Not found", "path": full_path})
+            # (same body HTTPException would produce, without the exception round trip)
+            return Response(
+                orjson.dumps({"detail": {"error": "Not found", "path": full_path}}),
+                status_code=404,
+                media_type="application/json",
+            )
 
-        file_path = frontend_dist / full_path if full_path else None
-        if file_path and file_path.exists() and file_path.is_file():
-            return FileResponse(str(file_path))
+        if full_path in frontend_files:
+            return FileResponse(str(frontend_dist / full_path))
 
-        index_path = frontend_dist / "index.html"
-        if index_path.exists():
-            return FileResponse(str(index_path))
-        return {"error": "Frontend not found"}
+        if index_html is not None:
+            return Response(index_html, media_type="text/html", headers=index_headers)
+        return Response(FRONTEND_NOT_FOUND, status_code=404, media_type="application/json")
 else:
     logger.warning(f"Frontend not found at {frontend_dist} - serving API only")
+    ROOT_PAYLOAD = orjson.dumps({**APP_INFO, "note": "Frontend UI not available - API only mode"})
 
     @app.get("/")
     async def root():
-        return {
-            "name": settings.APP_NAME,
-            "version": settings.APP_VERSION,
-            "status": "running",
-            "docs": "/docs",
-            "note": "Frontend UI not available - API only mode",
-        }
\ No newline at end of file
+        return Response(ROOT_PAYLOAD, media_type="application/json")
\ No newline at end of file
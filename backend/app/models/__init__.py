@@ -1,4 +1,10 @@
-"""Database models."""
+"""Database models.
+
+Imported eagerly on purpose: relationships are declared by class name (e.g.
+Provider.streams -> "ChannelStream"), so every mapped class must be in the
+registry before the first query configures the mappers, whichever model
+module a caller happened to import.
+"""
 from app.models.provider import Provider
 from app.models.channel import Channel, ChannelStream
 from app.models.vod import VODMovie, VODSeries, VODEpisode
@@ -7,7 +13,7 @@ from app.models.settings import AppSettings
 from app.models.user import User, UserFavorite, ViewingHistory
 from app.models.merge_rule import MergeRule
 
-__all__ = [
+__all__ = (
     "Provider",
     "Channel",
     "ChannelStream",
@@ -20,4 +26,4 @@ __all__ = [
     "UserFavorite",
     "ViewingHistory",
     "MergeRule",
-]
+)
@@ -1,6 +1,7 @@
 """Channel database models."""
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, ForeignKey, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, DateTime, Text, ForeignKey, Float, Index, select, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -9,6 +10,13 @@ class Channel(Base):
     """Merged channel model - represents a logical channel with multiple streams."""
 
     __tablename__ = "channels"
+    __table_args__ = (
+        # Category-filtered listings and playlists: WHERE category = ? AND enabled
+        Index("idx_channels_category_enabled", "category", "enabled"),
+        # HDHomeRun lineup and merged playlists: only playable channels, already in output order
+        Index("idx_channels_lineup", "category", "name",
+              postgresql_where=text("enabled AND stream_count > 0")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(500), nullable=False, index=True)
@@ -21,7 +29,7 @@ class Channel(Base):
 
     # Logo
     logo_url = Column(String(1000), nullable=True)
-    logo_hash = Column(String(64), nullable=True)  # For image-based matching
+    logo_hash = Column(BigInteger, nullable=True)  # 64-bit average hash of the logo, for image-based matching
 
     # EPG
     epg_id = Column(String(255), nullable=True, index=True)
@@ -29,11 +37,11 @@ class Channel(Base):
 
     # Status
     enabled = Column(Boolean, default=True)
-    stream_count = Column(Integer, default=0)  # Number of active streams
+    stream_count = Column(Integer, default=0)  # Number of active streams; maintained by a trigger on channel_streams
     last_watched = Column(DateTime(timezone=True), nullable=True)
 
-    # Metadata
-    tags = Column(JSON, nullable=True)  # Additional metadata
+    # Metadata (deferred: no listing reads it, so it stays out of the SELECT list)
+    tags = deferred(Column(JSONB, nullable=True))  # Additional metadata
     custom_order = Column(Integer, nullable=True)  # User-defined ordering
 
     # Timestamps
@@ -51,6 +59,12 @@ class ChannelStream(Base):
     """Individual stream from a provider - multiple streams can belong to one channel."""
 
     __tablename__ = "channel_streams"
+    __table_args__ = (
+        # Best-stream lookups: WHERE channel_id = ? AND is_active ORDER BY priority_order.
+        # Partial, so dead streams don't take up space in the index
+        Index("idx_channel_streams_active_priority", "channel_id", "priority_order",
+              postgresql_where=text("is_active")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     channel_id = Column(Integer, ForeignKey("channels.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -89,7 +103,7 @@ class ChannelStream(Base):
     # Original metadata from provider
     original_name = Column(String(500), nullable=True)
     original_category = Column(String(255), nullable=True)
-    provider_metadata = Column(JSON, nullable=True)
+    provider_metadata = deferred(Column(JSONB, nullable=True))  # Raw provider entry; only loaded on access
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -99,6 +113,22 @@ class ChannelStream(Base):
     channel = relationship("Channel", back_populates="streams")
     provider = relationship("Provider", back_populates="streams")
 
+    @classmethod
+    def best_active_per_channel(cls, *columns):
+        """Subquery yielding the highest-priority active stream of every channel.
+
+        Uses Postgres ``DISTINCT ON (channel_id)`` so playlist/lineup builders can
+        join it once instead of querying each channel's streams separately.
+        ``channel_id`` is always included; pass the other columns you need.
+        """
+        return (
+            select(cls.channel_id, *columns)
+            .where(cls.is_active.is_(True))
+            .distinct(cls.channel_id)
+            .order_by(cls.channel_id, cls.priority_order)
+            .subquery()
+        )
+
     def __repr__(self):
         return (
             f"<ChannelStream(id={self.id}, channel_id={self.channel_id}, "
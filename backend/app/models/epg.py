@@ -1,5 +1,5 @@
 """EPG (Electronic Program Guide) database models."""
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -8,15 +8,20 @@ class EPGProgram(Base):
     """EPG Program model."""
 
     __tablename__ = "epg_programs"
+    __table_args__ = (
+        # "Programs for a channel in a time window" is one contiguous range scan
+        Index("idx_epg_programs_channel_start", "channel_epg_id", "start_time"),
+        Index("idx_epg_programs_end_time", "end_time"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    channel_epg_id = Column(String(255), nullable=False, index=True)  # EPG channel ID
+    channel_epg_id = Column(String(255), nullable=False)  # EPG channel ID
     title = Column(String(500), nullable=False)
     description = Column(Text, nullable=True)
 
-    # Time
-    start_time = Column(DateTime(timezone=True), nullable=False, index=True)
-    end_time = Column(DateTime(timezone=True), nullable=False)
+    # Time: naive UTC, matching what EPGManager parses and compares against
+    start_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
 
     # Metadata
     category = Column(String(255), nullable=True)
@@ -2,17 +2,41 @@
 Merge Rules Model
 Allows users to create custom rules for channel merging
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey
+import re
+
+try:
+    import re2
+except ImportError:  # optional (pip install google-re2); fall back to the backtracking engine
+    re2 = None
+
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, CheckConstraint
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import reconstructor, relationship
 
 from app.core.database import Base
 
 
+def _compile(pattern: str):
+    """Compile a case-insensitive rule pattern with RE2 (linear time) when it can.
+
+    Patterns RE2 does not support (backreferences, lookarounds) use ``re``.
+    """
+    pattern = f"(?i){pattern}"
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
 class MergeRule(Base):
     """Custom rules for controlling automatic channel merging"""
     
     __tablename__ = "merge_rules"
+    __table_args__ = (
+        CheckConstraint("rule_type IN ('never_merge', 'always_merge', 'custom')", name="ck_merge_rules_rule_type"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -39,6 +63,16 @@ class MergeRule(Base):
     # Relationships
     provider = relationship("Provider")
     creator = relationship("User")
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._init_compiled()
+
+    @reconstructor
+    def _init_compiled(self):
+        """Compile the patterns once per instance; matches() runs for every channel pair."""
+        self._p1 = _compile(self.pattern1) if self.pattern1 else None
+        self._p2 = _compile(self.pattern2) if self.pattern2 else None
     
     def __repr__(self):
         return f"<MergeRule(id={self.id}, type='{self.rule_type}', pattern='{self.pattern1}')>"
@@ -46,23 +80,21 @@ class MergeRule(Base):
     def matches(self, channel1_name: str, channel2_name: str, 
                 channel1_region: str = None, channel2_region: str = None) -> bool:
         """Check if this rule applies to the given channel pair"""
-        import re
+        # Region filters first: plain string comparisons, no regex needed to reject
+        if self.region1 and channel1_region and self.region1 != channel1_region:
+            return False
+        
+        if self.region2 and channel2_region and self.region2 != channel2_region:
+            return False
         
         # Check pattern1 against channel1
-        if self.pattern1:
-            if not re.search(self.pattern1, channel1_name, re.IGNORECASE):
+        if self._p1 is not None:
+            if not self._p1.search(channel1_name):
                 return False
         
         # Check pattern2 against channel2 (for never_merge rules)
-        if self.pattern2:
-            if not re.search(self.pattern2, channel2_name, re.IGNORECASE):
+        if self._p2 is not None:
+            if not self._p2.search(channel2_name):
                 return False
         
-        # Check region filters
-        if self.region1 and channel1_region and self.region1 != channel1_region:
-            return False
-        
-        if self.region2 and channel2_region and self.region2 != channel2_region:
-            return False
-        
         return True
@@ -1,5 +1,5 @@
 """Provider database models."""
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, CheckConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -9,6 +9,9 @@ class Provider(Base):
     """IPTV Provider model."""
 
     __tablename__ = "providers"
+    __table_args__ = (
+        CheckConstraint("provider_type IN ('xstream', 'm3u')", name="ck_providers_provider_type"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), unique=True, nullable=False, index=True)
@@ -47,10 +50,15 @@ class Provider(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    # Relationships
-    streams = relationship("ChannelStream", back_populates="provider", cascade="all, delete-orphan")
-    vod_movies = relationship("VODMovie", back_populates="provider", cascade="all, delete-orphan")
-    vod_series = relationship("VODSeries", back_populates="provider", cascade="all, delete-orphan")
+    # Relationships - these collections run to tens of thousands of rows. They
+    # are never loaded implicitly (VOD ones raise instead), and deleting a
+    # provider leaves the child rows to the foreign keys' ON DELETE CASCADE.
+    streams = relationship("ChannelStream", back_populates="provider", cascade="all, delete-orphan",
+                           passive_deletes=True)
+    vod_movies = relationship("VODMovie", back_populates="provider", cascade="all, delete-orphan",
+                              lazy="raise_on_sql", passive_deletes=True)
+    vod_series = relationship("VODSeries", back_populates="provider", cascade="all, delete-orphan",
+                              lazy="raise_on_sql", passive_deletes=True)
 
     def __repr__(self):
         return f"<Provider(id={self.id}, name='{self.name}', type='{self.provider_type}')>"
@@ -1,5 +1,6 @@
 """Application settings database model."""
 from sqlalchemy import Column, Integer, String, Boolean, Text, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -11,7 +12,7 @@ class AppSettings(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     key = Column(String(255), unique=True, nullable=False, index=True)
-    value = Column(Text, nullable=True)  # Text to match migration, can store JSON as string
+    value = Column(JSONB(none_as_null=True), nullable=True)  # decoded by the driver, no json.loads per read
     value_type = Column(String(50), nullable=True)  # 'string', 'integer', 'boolean', etc.
     description = Column(Text, nullable=True)
 
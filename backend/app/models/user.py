@@ -1,5 +1,5 @@
 """User authentication models."""
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -60,11 +60,12 @@ class UserFavorite(Base):
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    # Relationships
+    # Relationships - the favorited item is rendered wherever a favorite is,
+    # so load it with one IN query per page instead of one query per row
     user = relationship("User", back_populates="favorites")
-    channel = relationship("Channel")
-    vod_movie = relationship("VODMovie")
-    vod_series = relationship("VODSeries")
+    channel = relationship("Channel", lazy="selectin")
+    vod_movie = relationship("VODMovie", lazy="selectin")
+    vod_series = relationship("VODSeries", lazy="selectin")
 
     def __repr__(self):
         return f"<UserFavorite(user_id={self.user_id}, channel_id={self.channel_id})>"
@@ -90,11 +91,16 @@ class ViewingHistory(Base):
     started_at = Column(DateTime(timezone=True), server_default=func.now())
     ended_at = Column(DateTime(timezone=True), nullable=True)
 
-    # Relationships
+    # Relationships (same loading as UserFavorite)
     user = relationship("User", back_populates="viewing_history")
-    channel = relationship("Channel")
-    vod_movie = relationship("VODMovie")
-    vod_series = relationship("VODSeries")
+    channel = relationship("Channel", lazy="selectin")
+    vod_movie = relationship("VODMovie", lazy="selectin")
+    vod_series = relationship("VODSeries", lazy="selectin")
+
+    __table_args__ = (
+        # A user's history newest first, with id as tie-breaker for keyset pages
+        Index("ix_viewing_history_user_recent", user_id, started_at.desc(), id.desc()),
+    )
 
     def __repr__(self):
         return f"<ViewingHistory(user_id={self.user_id}, channel_id={self.channel_id}, started_at={self.started_at})>"
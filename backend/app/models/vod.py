@@ -1,5 +1,6 @@
 """VOD (Video on Demand) database models."""
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, ForeignKey, Float, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -9,6 +10,9 @@ class VODMovie(Base):
     """VOD Movie model."""
 
     __tablename__ = "vod_movies"
+    __table_args__ = (
+        Index("idx_vod_movies_active_title_id", "is_active", "title", "id"),  # keyset pagination
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     provider_id = Column(Integer, ForeignKey("providers.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -43,7 +47,7 @@ class VODMovie(Base):
     last_check = Column(DateTime(timezone=True), nullable=True)
 
     # Metadata
-    provider_metadata = Column(JSON, nullable=True)  # Additional provider metadata
+    provider_metadata = Column(JSONB, nullable=True)  # Additional provider metadata
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -60,6 +64,9 @@ class VODSeries(Base):
     """VOD TV Series model."""
 
     __tablename__ = "vod_series"
+    __table_args__ = (
+        Index("idx_vod_series_active_title_id", "is_active", "title", "id"),  # keyset pagination
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     provider_id = Column(Integer, ForeignKey("providers.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -90,7 +97,7 @@ class VODSeries(Base):
     season_count = Column(Integer, default=0)
 
     # Metadata
-    provider_metadata = Column(JSON, nullable=True)
+    provider_metadata = Column(JSONB, nullable=True)
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -98,7 +105,9 @@ class VODSeries(Base):
 
     # Relationships
     provider = relationship("Provider", back_populates="vod_series")
-    episodes = relationship("VODEpisode", back_populates="series", cascade="all, delete-orphan")
+    # Load episodes explicitly (selectinload) when needed; an implicit load raises
+    episodes = relationship("VODEpisode", back_populates="series", cascade="all, delete-orphan",
+                            lazy="raise_on_sql", passive_deletes=True)
 
     def __repr__(self):
         return f"<VODSeries(id={self.id}, title='{self.title}', seasons={self.season_count})>"
@@ -134,7 +143,7 @@ class VODEpisode(Base):
     last_check = Column(DateTime(timezone=True), nullable=True)
 
     # Metadata
-    provider_metadata = Column(JSON, nullable=True)
+    provider_metadata = Column(JSONB, nullable=True)
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
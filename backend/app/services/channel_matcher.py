@@ -1,6 +1,7 @@
 """Channel matcher service - intelligent channel matching with region/variant detection."""
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from rapidfuzz import fuzz, process
 import imagehash
@@ -10,6 +11,35 @@ from io import BytesIO
 
 logger = logging.getLogger(__name__)
 
+# Applied in order, so kept as separate compiled patterns rather than one alternation
+_NOISE_RES = tuple(re.compile(p) for p in (
+    r'\[.*?\]',  # Remove [brackets]
+    r'\(.*?\)',  # Remove (parentheses)
+    r'^\s*[|-]?\s*',  # Remove leading dashes/pipes
+    r'\s*[|-]?\s*$',  # Remove trailing dashes/pipes
+    r'\s+',  # Normalize whitespace
+))
+
+
+@lru_cache(maxsize=16384)
+def normalize_channel_name(name: str) -> str:
+    """Normalize a channel name for matching.
+
+    Provider syncs see the same names over and over, so results are memoized
+    and each distinct name is normalized once per process.
+    """
+    if not name:
+        return ""
+
+    normalized = name.lower().strip()
+
+    # Remove noise patterns
+    for pattern in _NOISE_RES:
+        normalized = pattern.sub(' ', normalized)
+
+    # Normalize whitespace
+    return ' '.join(normalized.split())
+
 
 class ChannelMatcher:
     """Intelligent channel matching with fuzzy string matching and region awareness."""
@@ -29,15 +59,6 @@ class ChannelMatcher:
         "1", "2", "3", "news", "sports", "movies"
     ]
 
-    # Patterns to remove for normalization
-    NOISE_PATTERNS = [
-        r'\[.*?\]',  # Remove [brackets]
-        r'\(.*?\)',  # Remove (parentheses)
-        r'^\s*[|-]?\s*',  # Remove leading dashes/pipes
-        r'\s*[|-]?\s*$',  # Remove trailing dashes/pipes
-        r'\s+',  # Normalize whitespace
-    ]
-
     def __init__(self, fuzzy_threshold: int = 85, enable_logo_matching: bool = True,
                  logo_threshold: int = 90):
         """
@@ -51,7 +72,7 @@ class ChannelMatcher:
         self.fuzzy_threshold = fuzzy_threshold
         self.enable_logo_matching = enable_logo_matching
         self.logo_threshold = logo_threshold
-        self.logo_cache: Dict[str, str] = {}  # URL -> hash
+        self.logo_cache: Dict[str, imagehash.ImageHash] = {}  # URL -> hash
 
     def normalize_name(self, name: str) -> str:
         """
@@ -63,19 +84,7 @@ class ChannelMatcher:
         Returns:
             Normalized name
         """
-        if not name:
-            return ""
-
-        normalized = name.lower().strip()
-
-        # Remove noise patterns
-        for pattern in self.NOISE_PATTERNS:
-            normalized = re.sub(pattern, ' ', normalized)
-
-        # Normalize whitespace
-        normalized = ' '.join(normalized.split())
-
-        return normalized
+        return normalize_channel_name(name)
 
     def extract_region(self, name: str) -> Optional[str]:
         """
@@ -260,13 +269,10 @@ class ChannelMatcher:
         Returns:
             Image hash or None if failed
         """
-        # Check cache
-        if url in self.logo_cache:
-            try:
-                return imagehash.hex_to_hash(self.logo_cache[url])
-            except (ValueError, TypeError) as e:
-                logger.debug(f"Invalid cached hash for {url}: {e}")
-                del self.logo_cache[url]  # Remove invalid cache entry
+        # Check cache (hash objects are kept as-is; no hex round trip per comparison)
+        cached = self.logo_cache.get(url)
+        if cached is not None:
+            return cached
 
         try:
             async with httpx.AsyncClient(timeout=10) as client:
@@ -277,7 +283,7 @@ class ChannelMatcher:
                 img_hash = imagehash.average_hash(image)
 
                 # Cache the hash
-                self.logo_cache[url] = str(img_hash)
+                self.logo_cache[url] = img_hash
 
                 return img_hash
 
@@ -233,11 +233,16 @@ class EPGManager:
         }
 
     def _parse_timestamp(self, timestamp: str) -> Optional[datetime]:
-        """Parse XMLTV timestamp."""
+        """Parse an XMLTV timestamp into a naive UTC datetime."""
         try:
-            # Remove timezone for simplicity (format: YYYYMMDDHHmmss +0000)
-            timestamp = timestamp.split()[0]
-            return datetime.strptime(timestamp, '%Y%m%d%H%M%S')
+            # Format: YYYYMMDDHHmmss +HHMM; shift by the offset and drop it
+            parts = timestamp.split()
+            dt = datetime.strptime(parts[0], '%Y%m%d%H%M%S')
+            if len(parts) > 1:
+                offset = parts[1]
+                delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5]))
+                dt = dt + delta if offset[0] == '-' else dt - delta
+            return dt
         except Exception as e:
             logger.debug(f"Failed to parse timestamp {timestamp}: {str(e)}")
             return None
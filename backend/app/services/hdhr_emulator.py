@@ -79,56 +79,43 @@ class HDHomeRunEmulator:
             List of channel dictionaries
         """
         try:
-            # Get all enabled channels with active streams
+            # Enabled channels joined to their best active stream in one query
+            best = ChannelStream.best_active_per_channel(
+                ChannelStream.stream_url, ChannelStream.resolution
+            )
             result = await db.execute(
-                select(Channel)
+                select(
+                    Channel.id, Channel.name, Channel.logo_url,
+                    best.c.stream_url, best.c.resolution
+                )
+                .join(best, best.c.channel_id == Channel.id)
                 .where(Channel.enabled.is_(True), Channel.stream_count > 0)
                 .order_by(Channel.category, Channel.name)
             )
-            channels = result.scalars().all()
 
+            # Loop-invariant pieces of each entry
+            proxy = proxy_mode == "proxy"
+            url_prefix = f"{base_url}/auto/v"
             lineup = []
-            channel_number = 1
-
-            for channel in channels:
-                # Get best stream
-                stream_result = await db.execute(
-                    select(ChannelStream)
-                    .where(
-                        ChannelStream.channel_id == channel.id,
-                        ChannelStream.is_active.is_(True)
-                    )
-                    .order_by(ChannelStream.priority_order)
-                    .limit(1)
-                )
-                best_stream = stream_result.scalar_one_or_none()
+            append = lineup.append
 
-                if not best_stream:
-                    continue
-
-                # Determine stream URL based on mode
-                if proxy_mode == "proxy":
-                    stream_url = f"{base_url}/auto/v{channel.id}"
-                else:
-                    # Direct mode - redirect to original stream
-                    stream_url = best_stream.stream_url
+            for channel_number, channel in enumerate(result.all(), start=1):
+                name = channel.name
 
+                # Proxy mode streams through us; direct mode redirects to the original stream
                 lineup_entry = {
                     "GuideNumber": str(channel_number),
-                    "GuideName": channel.name,
-                    "URL": stream_url
+                    "GuideName": name,
+                    "URL": f"{url_prefix}{channel.id}" if proxy else channel.stream_url
                 }
 
                 # Add optional fields if available
                 if channel.logo_url:
-                    is_hd = (
-                        "hd" in channel.name.lower() or
-                        "1080" in str(best_stream.resolution or "").lower()
-                    )
+                    resolution = channel.resolution
+                    is_hd = "hd" in name.lower() or (resolution is not None and "1080" in resolution.lower())
                     lineup_entry["HD"] = 1 if is_hd else 0
 
-                lineup.append(lineup_entry)
-                channel_number += 1
+                append(lineup_entry)
 
             logger.info(f"Generated HDHomeRun lineup with {len(lineup)} channels")
             return lineup
@@ -151,31 +138,17 @@ class HDHomeRunEmulator:
             Stream URL or None
         """
         try:
-            # Get channel
+            # Best active stream; no row also covers a missing channel
             result = await db.execute(
-                select(Channel).where(Channel.id == channel_id)
-            )
-            channel = result.scalar_one_or_none()
-
-            if not channel:
-                return None
-
-            # Get best active stream
-            stream_result = await db.execute(
-                select(ChannelStream)
+                select(ChannelStream.stream_url)
                 .where(
-                    ChannelStream.channel_id == channel.id,
+                    ChannelStream.channel_id == channel_id,
                     ChannelStream.is_active.is_(True)
                 )
                 .order_by(ChannelStream.priority_order)
                 .limit(1)
             )
-            best_stream = stream_result.scalar_one_or_none()
-
-            if not best_stream:
-                return None
-
-            return best_stream.stream_url
+            return result.scalar_one_or_none()
 
         except Exception as e:
             logger.error(f"Error getting stream URL for channel {channel_id}: {str(e)}")
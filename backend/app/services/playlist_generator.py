@@ -5,6 +5,7 @@ from typing import List, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.channel import Channel, ChannelStream
+from app.utils.paths import ensure_dir
 
 logger = logging.getLogger(__name__)
 
@@ -20,86 +21,116 @@ class PlaylistGenerator:
             output_dir: Directory for playlist output
         """
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    async def generate_merged_playlist(self, db: AsyncSession, category: Optional[str] = None) -> str:
-        """
-        Generate merged M3U playlist.
+    @staticmethod
+    def _merged_query():
+        """Enabled channels joined to their best active stream, in playlist order."""
+        best = ChannelStream.best_active_per_channel(
+            ChannelStream.stream_url, ChannelStream.resolution
+        )
+        return (
+            select(
+                Channel.tvg_id, Channel.name, Channel.logo_url, Channel.category,
+                best.c.stream_url, best.c.resolution
+            )
+            .join(best, best.c.channel_id == Channel.id)
+            .where(Channel.enabled.is_(True), Channel.stream_count > 0)
+            .order_by(Channel.category, Channel.name)
+        )
 
-        Args:
-            db: Database session
-            category: Optional category filter
+    @staticmethod
+    def _merged_entry(channel) -> bytearray:
+        """Encode one EXTINF/URL pair of a merged playlist row."""
+        name = channel.name.encode('utf-8')
+        category = (channel.category or "").encode('utf-8')
 
-        Returns:
-            Path to generated playlist
-        """
-        try:
-            # Build query
-            query = select(Channel).where(Channel.enabled.is_(True), Channel.stream_count > 0)
+        # Build EXTINF line from bytes templates; optional attributes only when set
+        entry = bytearray(b"\n#EXTINF:-1")
 
-            if category:
-                query = query.where(Channel.category == category)
+        if channel.tvg_id:
+            entry += b' tvg-id="%b"' % channel.tvg_id.encode('utf-8')
 
-            query = query.order_by(Channel.category, Channel.name)
+        entry += b' tvg-name="%b"' % name
 
-            result = await db.execute(query)
-            channels = result.scalars().all()
+        if channel.logo_url:
+            entry += b' tvg-logo="%b"' % channel.logo_url.encode('utf-8')
 
-            logger.info(f"Generating playlist for {len(channels)} channels")
+        if category:
+            entry += b' group-title="%b"' % category
 
-            # Generate M3U content
-            m3u_lines = ["#EXTM3U"]
+        # Add resolution if available
+        if channel.resolution:
+            entry += b' group-title="%b - %b"' % (category, channel.resolution.encode('utf-8'))
 
-            for channel in channels:
-                # Get best stream (first by priority_order)
-                stream_result = await db.execute(
-                    select(ChannelStream)
-                    .where(
-                        ChannelStream.channel_id == channel.id,
-                        ChannelStream.is_active.is_(True)
-                    )
-                    .order_by(ChannelStream.priority_order)
-                    .limit(1)
-                )
-                best_stream = stream_result.scalar_one_or_none()
+        entry += b",%b\n%b" % (name, channel.stream_url.encode('utf-8'))
+        return entry
 
-                if not best_stream:
-                    continue
+    @staticmethod
+    def _multi_quality_entry(stream, idx: int) -> bytearray:
+        """Encode one EXTINF/URL pair of a multi-quality playlist row.
 
-                # Build EXTINF line
-                extinf_parts = [
-                    "#EXTINF:-1",
-                ]
+        ``idx`` is the stream's position within its channel.
+        """
+        resolution = (stream.resolution or "").encode('utf-8')
 
-                # Add attributes
-                if channel.tvg_id:
-                    extinf_parts.append(f'tvg-id="{channel.tvg_id}"')
+        # Build channel name with quality indicator
+        channel_name = stream.name.encode('utf-8')
+        if resolution:
+            channel_name += b" [%b]" % resolution
+        elif idx > 0:
+            channel_name += b" [Stream %d]" % (idx + 1)
 
-                extinf_parts.append(f'tvg-name="{channel.name}"')
+        entry = bytearray(b"\n#EXTINF:-1")
 
-                if channel.logo_url:
-                    extinf_parts.append(f'tvg-logo="{channel.logo_url}"')
+        if stream.tvg_id:
+            entry += b' tvg-id="%b"' % stream.tvg_id.encode('utf-8')
 
-                if channel.category:
-                    extinf_parts.append(f'group-title="{channel.category}"')
+        entry += b' tvg-name="%b"' % channel_name
 
-                # Add resolution if available
-                if best_stream.resolution:
-                    extinf_parts.append(f'group-title="{channel.category} - {best_stream.resolution}"')
+        if stream.logo_url:
+            entry += b' tvg-logo="%b"' % stream.logo_url.encode('utf-8')
 
-                # Add channel name
-                extinf_line = " ".join(extinf_parts) + f",{channel.name}"
+        if stream.category:
+            if resolution:
+                entry += b' group-title="%b - %b"' % (stream.category.encode('utf-8'), resolution)
+            else:
+                entry += b' group-title="%b"' % stream.category.encode('utf-8')
 
-                m3u_lines.append(extinf_line)
-                m3u_lines.append(best_stream.stream_url)
+        entry += b",%b\n%b" % (channel_name, stream.stream_url.encode('utf-8'))
+        return entry
+
+    async def generate_merged_playlist(self, db: AsyncSession, category: Optional[str] = None) -> str:
+        """
+        Generate merged M3U playlist.
+
+        Args:
+            db: Database session
+            category: Optional category filter
+
+        Returns:
+            Path to generated playlist
+        """
+        try:
+            query = self._merged_query()
+
+            if category:
+                query = query.where(Channel.category == category)
 
-            # Write to file
             filename = f"merged_playlist_{category if category else 'all'}.m3u"
-            output_path = self.output_dir / filename
+            output_path = ensure_dir(self.output_dir) / filename
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(m3u_lines))
+            # Stream rows straight into the file instead of building the playlist in memory
+            count = 0
+            result = await db.stream(query)
 
+            with open(output_path, 'wb') as f:
+                f.write(b"#EXTM3U")
+
+                async for channel in result:
+                    f.write(self._merged_entry(channel))
+                    count += 1
+
+            logger.info(f"Wrote {count} channels to playlist")
             logger.info(f"Generated playlist: {output_path}")
             return str(output_path)
 
@@ -122,78 +153,48 @@ class PlaylistGenerator:
             Path to generated playlist
         """
         try:
-            # Build query
-            query = select(Channel).where(Channel.enabled.is_(True), Channel.stream_count > 0)
+            # One pass over every active stream, grouped by channel in order
+            query = (
+                select(
+                    Channel.id, Channel.tvg_id, Channel.name, Channel.logo_url, Channel.category,
+                    ChannelStream.stream_url, ChannelStream.resolution
+                )
+                .join(ChannelStream, ChannelStream.channel_id == Channel.id)
+                .where(
+                    Channel.enabled.is_(True),
+                    Channel.stream_count > 0,
+                    ChannelStream.is_active.is_(True)
+                )
+            )
 
             if category:
                 query = query.where(Channel.category == category)
 
-            query = query.order_by(Channel.category, Channel.name)
-
-            result = await db.execute(query)
-            channels = result.scalars().all()
-
-            logger.info(f"Generating multi-quality playlist for {len(channels)} channels")
-
-            # Generate M3U content
-            m3u_lines = ["#EXTM3U"]
-
-            for channel in channels:
-                # Get all active streams sorted by priority
-                streams_result = await db.execute(
-                    select(ChannelStream)
-                    .where(
-                        ChannelStream.channel_id == channel.id,
-                        ChannelStream.is_active.is_(True)
-                    )
-                    .order_by(ChannelStream.priority_order)
-                )
-                streams = streams_result.scalars().all()
-
-                if not streams:
-                    continue
-
-                for idx, stream in enumerate(streams):
-                    # Build channel name with quality indicator
-                    quality_suffix = ""
-                    if stream.resolution:
-                        quality_suffix = f" [{stream.resolution}]"
-                    elif idx > 0:
-                        quality_suffix = f" [Stream {idx + 1}]"
-
-                    channel_name = f"{channel.name}{quality_suffix}"
-
-                    # Build EXTINF line
-                    extinf_parts = [
-                        "#EXTINF:-1",
-                    ]
-
-                    if channel.tvg_id:
-                        extinf_parts.append(f'tvg-id="{channel.tvg_id}"')
-
-                    extinf_parts.append(f'tvg-name="{channel_name}"')
-
-                    if channel.logo_url:
-                        extinf_parts.append(f'tvg-logo="{channel.logo_url}"')
+            query = query.order_by(
+                Channel.category, Channel.name, Channel.id, ChannelStream.priority_order
+            )
 
-                    if channel.category:
-                        category_name = channel.category
-                        if stream.resolution:
-                            category_name += f" - {stream.resolution}"
-                        extinf_parts.append(f'group-title="{category_name}"')
+            filename = f"multi_quality_{category if category else 'all'}.m3u"
+            output_path = ensure_dir(self.output_dir) / filename
 
-                    extinf_line = " ".join(extinf_parts) + f",{channel_name}"
+            # Stream rows straight into the file instead of building the playlist in memory
+            count = 0
+            idx = 0
+            channel_id = None
+            result = await db.stream(query)
 
-                    m3u_lines.append(extinf_line)
-                    m3u_lines.append(stream.stream_url)
+            with open(output_path, 'wb') as f:
+                f.write(b"#EXTM3U")
 
-            # Write to file
-            filename = f"multi_quality_{category if category else 'all'}.m3u"
-            output_path = self.output_dir / filename
+                async for stream in result:
+                    # Position of this stream within its channel (rows arrive grouped)
+                    idx = idx + 1 if stream.id == channel_id else 0
+                    channel_id = stream.id
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(m3u_lines))
+                    f.write(self._multi_quality_entry(stream, idx))
+                    count += 1
 
+            logger.info(f"Wrote {count} streams to multi-quality playlist")
             logger.info(f"Generated multi-quality playlist: {output_path}")
             return str(output_path)
 
@@ -212,21 +213,32 @@ class PlaylistGenerator:
             List of generated playlist paths
         """
         try:
-            # Get all categories
-            result = await db.execute(
-                select(Channel.category)
-                .where(Channel.enabled.is_(True), Channel.stream_count > 0)
-                .distinct()
+            # One pass over all categories; rows arrive grouped by category,
+            # so each playlist file is opened when its first row shows up
+            query = self._merged_query().where(
+                Channel.category.is_not(None), Channel.category != ""
             )
-            categories = [row[0] for row in result.all() if row[0]]
-
-            logger.info(f"Generating playlists for {len(categories)} categories")
+            result = await db.stream(query)
 
             playlist_paths = []
-
-            for category in categories:
-                path = await self.generate_merged_playlist(db, category)
-                playlist_paths.append(path)
+            current_category = None
+            f = None
+
+            try:
+                async for channel in result:
+                    if channel.category != current_category:
+                        if f is not None:
+                            f.close()
+                        current_category = channel.category
+                        output_path = ensure_dir(self.output_dir) / f"merged_playlist_{current_category}.m3u"
+                        f = open(output_path, 'wb')
+                        f.write(b"#EXTM3U")
+                        playlist_paths.append(str(output_path))
+
+                    f.write(self._merged_entry(channel))
+            finally:
+                if f is not None:
+                    f.close()
 
             logger.info(f"Generated {len(playlist_paths)} category playlists")
             return playlist_paths
@@ -208,7 +208,7 @@ class M3UProvider:
                     "group_title": item.get("group-title", ""),
                     "tvg_country": item.get("tvg-country", ""),
                     "tvg_language": item.get("tvg-language", ""),
-                    "metadata": item  # Store all original metadata
+                    "provider_metadata": item  # Store all original metadata
                 }
                 channels.append(channel)
 
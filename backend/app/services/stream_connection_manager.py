@@ -1,7 +1,6 @@
-import asyncio
+import time
 from dataclasses import dataclass
 from typing import Dict
-from datetime import datetime, timezone
 
 from .stream_proxy import StreamProxy
 
@@ -12,40 +11,42 @@ def _key(stream_url: str, channel_id: int) -> str:
 
 @dataclass
 class StreamConnectionManager:
+    """Registry of shared upstream proxies keyed by channel and URL.
+
+    All access happens on the single event-loop thread, and the lookup/insert
+    and pop sections below contain no suspension points, so no lock is needed.
+    """
+
     active_streams: Dict[str, StreamProxy]
-    lock: asyncio.Lock
 
     def __init__(self):
         self.active_streams = {}
-        self.lock = asyncio.Lock()
 
     async def get_or_create_stream(self, stream_url: str, channel_id: int) -> StreamProxy:
         k = _key(stream_url, channel_id)
-        async with self.lock:
-            proxy = self.active_streams.get(k)
-            if proxy is None or proxy._closed:
-                proxy = StreamProxy(stream_url=stream_url, channel_id=channel_id)
-                await proxy.start()
-                self.active_streams[k] = proxy
-            return proxy
+        proxy = self.active_streams.get(k)
+        if proxy is None or proxy._closed:
+            proxy = StreamProxy(stream_url=stream_url, channel_id=channel_id)
+            # Register before start() so a concurrent caller reuses this proxy
+            self.active_streams[k] = proxy
+            await proxy.start()
+        return proxy
 
     async def release_stream(self, stream_url: str, channel_id: int) -> None:
         k = _key(stream_url, channel_id)
-        async with self.lock:
-            proxy = self.active_streams.get(k)
-            if proxy and proxy.client_count == 0 and proxy._closed:
-                self.active_streams.pop(k, None)
+        proxy = self.active_streams.get(k)
+        if proxy and proxy.client_count == 0 and proxy._closed:
+            self.active_streams.pop(k, None)
 
     async def cleanup_idle_streams(self, max_idle_seconds: int = 300) -> None:
-        now = datetime.now(timezone.utc)
-        async with self.lock:
-            to_remove = []
-            for k, proxy in list(self.active_streams.items()):
-                if proxy.client_count == 0 and (now - proxy.last_activity).total_seconds() > max_idle_seconds:
-                    await proxy.close()
-                    to_remove.append(k)
-            for k in to_remove:
-                self.active_streams.pop(k, None)
+        now_ms = time.time_ns() // 1_000_000
+        # Snapshot only because close() may suspend while we mutate the dict
+        for k, proxy in list(self.active_streams.items()):
+            if proxy.client_count == 0 and proxy.idle_seconds(now_ms) > max_idle_seconds:
+                await proxy.close()
+                # A new proxy may have replaced this key while close() awaited
+                if self.active_streams.get(k) is proxy:
+                    del self.active_streams[k]
 
     def get_stats(self) -> dict:
         streams = []
@@ -59,6 +60,7 @@ class StreamConnectionManager:
                 "running": p.is_running,
                 "created_at": p.created_at.isoformat(),
                 "last_activity": p.last_activity.isoformat(),
+                "last_activity_ms": p.last_activity_ms,
             })
             total_clients += p.client_count
         return {
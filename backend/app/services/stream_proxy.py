@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import AsyncGenerator, Optional
@@ -9,6 +10,11 @@ import httpx
 logger = logging.getLogger(__name__)
 
 
+def _now_ms() -> int:
+    """Wall-clock milliseconds since the epoch (cheap activity stamp)."""
+    return time.time_ns() // 1_000_000
+
+
 @dataclass
 class StreamProxy:
     """A single upstream stream connection shared by multiple clients."""
@@ -23,7 +29,8 @@ class StreamProxy:
     _fetch_task: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
     _closed: bool = field(default=False, init=False)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc), init=False)
-    last_activity: datetime = field(default_factory=lambda: datetime.now(timezone.utc), init=False)
+    # Stamped per upstream chunk, so kept as an int instead of a datetime
+    last_activity_ms: int = field(default_factory=_now_ms, init=False)
 
     def __post_init__(self):
         self._queue = asyncio.Queue(self.buffer_size)
@@ -36,6 +43,13 @@ class StreamProxy:
     def is_running(self) -> bool:
         return self._fetch_task is not None and not self._fetch_task.done()
 
+    @property
+    def last_activity(self) -> datetime:
+        return datetime.fromtimestamp(self.last_activity_ms / 1000, tz=timezone.utc)
+
+    def idle_seconds(self, now_ms: Optional[int] = None) -> float:
+        return ((now_ms or _now_ms()) - self.last_activity_ms) / 1000
+
     async def start(self):
         if self._fetch_task is None:
             self._fetch_task = asyncio.create_task(self._fetch_stream())
@@ -43,13 +57,13 @@ class StreamProxy:
 
     def add_client(self):
         self._clients += 1
-        self.last_activity = datetime.now(timezone.utc)
+        self.last_activity_ms = _now_ms()
         logger.debug("[StreamProxy] add_client channel_id=%s clients=%d", self.channel_id, self._clients)
 
     def remove_client(self):
         if self._clients > 0:
             self._clients -= 1
-        self.last_activity = datetime.now(timezone.utc)
+        self.last_activity_ms = _now_ms()
         logger.debug("[StreamProxy] remove_client channel_id=%s clients=%d", self.channel_id, self._clients)
 
     async def read_chunks(self) -> AsyncGenerator[bytes, None]:
@@ -82,8 +96,9 @@ class StreamProxy:
                             except asyncio.QueueEmpty:
                                 pass
                         await self._queue.put(chunk)
-                        self.last_activity = datetime.now(timezone.utc)
-                        if self._clients == 0 and (datetime.now(timezone.utc) - self.last_activity).total_seconds() > self.idle_timeout:
+                        now_ms = _now_ms()
+                        self.last_activity_ms = now_ms
+                        if self._clients == 0 and self.idle_seconds(now_ms) > self.idle_timeout:
                             logger.info("[StreamProxy] Idle timeout channel_id=%s closing", self.channel_id)
                             break
         except Exception as e:
@@ -4,6 +4,7 @@ import re
 import logging
 from typing import Dict, List, Optional
 from pathlib import Path
+from app.utils.paths import ensure_dir, forget_dirs
 
 logger = logging.getLogger(__name__)
 
@@ -21,10 +22,7 @@ class VODManager:
         self.output_dir = Path(output_dir)
         self.movies_dir = self.output_dir / "Movies"
         self.series_dir = self.output_dir / "TV Shows"
-
-        # Create directories
-        self.movies_dir.mkdir(parents=True, exist_ok=True)
-        self.series_dir.mkdir(parents=True, exist_ok=True)
+        # Directories are created on first write, see ensure_dir
 
     def sanitize_filename(self, name: str) -> str:
         """
@@ -78,14 +76,9 @@ class VODManager:
             else:
                 folder_name = safe_title
 
-            # Create genre folder
+            # Create genre/movie folders
             safe_genre = self.sanitize_filename(genre)
-            genre_dir = self.movies_dir / safe_genre
-            genre_dir.mkdir(parents=True, exist_ok=True)
-
-            # Create movie folder
-            movie_dir = genre_dir / folder_name
-            movie_dir.mkdir(parents=True, exist_ok=True)
+            movie_dir = ensure_dir(self.movies_dir / safe_genre / folder_name)
 
             # Create .strm filename
             strm_filename = f"{folder_name}.strm"
@@ -142,7 +135,7 @@ class VODManager:
             season_dir = series_dir / f"Season {season_num:02d}"
 
             # Create directories
-            season_dir.mkdir(parents=True, exist_ok=True)
+            ensure_dir(season_dir)
 
             # Create .strm filename: "Series - S01E05 - Episode Title.strm"
             safe_episode_title = self.sanitize_filename(episode_title)
@@ -278,6 +271,7 @@ class VODManager:
                 parent = path.parent
                 if parent.exists() and not any(parent.iterdir()):
                     parent.rmdir()
+                    forget_dirs()
 
                 return True
         except Exception as e:
@@ -3,6 +3,7 @@ import logging
 from datetime import datetime
 from sqlalchemy import select, update
 from app.tasks.celery_app import celery_app
+from app.core.cache import CacheManager
 from app.core.database import get_session_factory
 from app.models.channel import ChannelStream, Channel
 from app.services.health_checker import StreamHealthChecker
@@ -102,8 +103,9 @@ async def _run_health_check_async():
                 await db.commit()
                 logger.info(f"Batch completed. Alive: {total_alive}, Dead: {total_dead}")
 
-            # Update channel stream counts
-            await _update_channel_stream_counts(db)
+            # Re-rank streams now that health results are in
+            await _reprioritize_channel_streams(db)
+            await CacheManager.invalidate_channel_cache()
 
             logger.info(f"Health check completed. Total: {total_checked}, Alive: {total_alive}, Dead: {total_dead}")
 
@@ -112,29 +114,17 @@ async def _run_health_check_async():
             await db.rollback()
 
 
-async def _update_channel_stream_counts(db):
-    """Update stream counts for all channels using optimized single query."""
-    from sqlalchemy import func
-    
-    # Get all channels with their active stream counts in a single query
-    result = await db.execute(
-        select(
-            ChannelStream.channel_id,
-            func.count(ChannelStream.id).label('active_count')
-        )
-        .where(ChannelStream.is_active.is_(True))
-        .group_by(ChannelStream.channel_id)
-    )
-    
-    stream_counts = {row.channel_id: row.active_count for row in result.all()}
-    
+async def _reprioritize_channel_streams(db):
+    """Re-prioritize each channel's active streams by quality.
+
+    channels.stream_count itself is maintained by a database trigger on
+    channel_streams (migration 012), so it is already current here.
+    """
     # Get all channels
     result = await db.execute(select(Channel))
     channels = result.scalars().all()
     
     for channel in channels:
-        channel.stream_count = stream_counts.get(channel.id, 0)
-        
         # Re-prioritize streams for this channel
         result = await db.execute(
             select(ChannelStream)
@@ -229,6 +219,7 @@ async def _check_provider_streams_async(provider_id: int):
                             stream.is_active = False
 
             await db.commit()
+            await CacheManager.invalidate_channel_cache()
             logger.info(f"Health check completed for provider {provider_id}")
 
         except Exception as e:
@@ -1,8 +1,9 @@
 """Provider synchronization tasks."""
 import logging
 from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from app.tasks.celery_app import celery_app
+from app.core.cache import CacheManager
 from app.core.database import get_session_factory
 from app.models.provider import Provider
 from app.models.channel import Channel, ChannelStream
@@ -71,6 +72,7 @@ async def _sync_provider_async(provider_id: int):
             # Update sync timestamp
             provider.last_sync = datetime.utcnow()
             await db.commit()
+            await CacheManager.invalidate_channel_cache()
 
             logger.info(f"Sync completed for provider: {provider.name}")
 
@@ -93,7 +95,10 @@ async def _sync_xstream_provider(db, provider, matcher, quality_analyzer):
     logger.info(f"Fetched {len(streams)} streams from {provider.name}")
 
     channel_count = 0
-    stream_count = 0
+    # New streams are collected and inserted in one batched statement at the end;
+    # adding them one by one let every per-row SELECT autoflush a single INSERT
+    new_streams = []
+    pending = set()  # (channel_id, stream_url) queued this run
 
     for stream_data in streams:
         try:
@@ -124,6 +129,10 @@ async def _sync_xstream_provider(db, provider, matcher, quality_analyzer):
                 # Analyze quality
                 quality_info = await quality_analyzer.analyze_stream(stream_url, channel_name, quick_mode=True)
 
+                key = (channel.id, stream_url)
+                if key in pending:
+                    continue
+
                 # Check if stream already exists
                 existing_stream = await db.execute(
                     select(ChannelStream).where(
@@ -135,8 +144,9 @@ async def _sync_xstream_provider(db, provider, matcher, quality_analyzer):
                 existing_stream = existing_stream.scalar_one_or_none()
 
                 if not existing_stream:
-                    # Create new stream with merge metadata
-                    new_stream = ChannelStream(
+                    # Queue new stream with merge metadata
+                    pending.add(key)
+                    new_streams.append(dict(
                         channel_id=channel.id,
                         provider_id=provider.id,
                         stream_url=stream_url,
@@ -153,9 +163,7 @@ async def _sync_xstream_provider(db, provider, matcher, quality_analyzer):
                         merge_confidence=merge_info.get('confidence'),
                         merge_method=merge_info.get('method'),
                         merge_reason=merge_info.get('reason')
-                    )
-                    db.add(new_stream)
-                    stream_count += 1
+                    ))
                 else:
                     # Update existing stream quality info
                     existing_stream.resolution = quality_info.get('resolution') or existing_stream.resolution
@@ -166,12 +174,15 @@ async def _sync_xstream_provider(db, provider, matcher, quality_analyzer):
             logger.error(f"Error processing stream {stream_data.get('name')}: {str(e)}")
             continue
 
+    if new_streams:
+        await db.execute(insert(ChannelStream), new_streams)
+
     # Update provider stats
     provider.total_channels = channel_count
     provider.active_channels = channel_count
 
     await db.commit()
-    logger.info(f"Synced {channel_count} channels and {stream_count} new streams")
+    logger.info(f"Synced {channel_count} channels and {len(new_streams)} new streams")
 
 
 async def _sync_m3u_provider(db, provider, matcher, quality_analyzer):
@@ -186,7 +197,8 @@ async def _sync_m3u_provider(db, provider, matcher, quality_analyzer):
     logger.info(f"Parsed {len(channels_data)} channels from {provider.name}")
 
     channel_count = 0
-    stream_count = 0
+    new_streams = []  # inserted in one batch at the end, as in _sync_xstream_provider
+    pending = set()
 
     for channel_data in channels_data:
         try:
@@ -218,38 +230,38 @@ async def _sync_m3u_provider(db, provider, matcher, quality_analyzer):
                 # Analyze quality
                 quality_info = await quality_analyzer.analyze_stream(stream_url, channel_name, quick_mode=True)
 
-                # Check if stream already exists
-                existing_stream = await db.execute(
-                    select(ChannelStream).where(
-                        ChannelStream.channel_id == channel.id,
-                        ChannelStream.provider_id == provider.id,
-                        ChannelStream.stream_url == stream_url
+                key = (channel.id, stream_url)
+                if key not in pending:
+                    # Check if stream already exists
+                    existing_stream = await db.scalar(
+                        select(ChannelStream.id).where(
+                            ChannelStream.channel_id == channel.id,
+                            ChannelStream.provider_id == provider.id,
+                            ChannelStream.stream_url == stream_url
+                        ).limit(1)
                     )
-                )
-                existing_stream = existing_stream.scalar_one_or_none()
 
-                if not existing_stream:
-                    # Create new stream with merge metadata
-                    new_stream = ChannelStream(
-                        channel_id=channel.id,
-                        provider_id=provider.id,
-                        stream_url=stream_url,
-                        stream_format='m3u8' if '.m3u8' in stream_url else 'ts',
-                        original_name=channel_name,
-                        original_category=category,
-                        resolution=quality_info.get('resolution'),
-                        bitrate=quality_info.get('bitrate'),
-                        codec=quality_info.get('codec'),
-                        quality_score=quality_info.get('quality_score', 0),
-                        is_active=True,
-                        metadata=channel_data,
-                        # Merge metadata from find_or_create_channel
-                        merge_confidence=merge_info.get('confidence'),
-                        merge_method=merge_info.get('method'),
-                        merge_reason=merge_info.get('reason')
-                    )
-                    db.add(new_stream)
-                    stream_count += 1
+                    if existing_stream is None:
+                        # Queue new stream with merge metadata
+                        pending.add(key)
+                        new_streams.append(dict(
+                            channel_id=channel.id,
+                            provider_id=provider.id,
+                            stream_url=stream_url,
+                            stream_format='m3u8' if '.m3u8' in stream_url else 'ts',
+                            original_name=channel_name,
+                            original_category=category,
+                            resolution=quality_info.get('resolution'),
+                            bitrate=quality_info.get('bitrate'),
+                            codec=quality_info.get('codec'),
+                            quality_score=quality_info.get('quality_score', 0),
+                            is_active=True,
+                            provider_metadata=channel_data.get('provider_metadata'),
+                            # Merge metadata from find_or_create_channel
+                            merge_confidence=merge_info.get('confidence'),
+                            merge_method=merge_info.get('method'),
+                            merge_reason=merge_info.get('reason')
+                        ))
 
                 # Update channel EPG ID
                 if tvg_id and not channel.tvg_id:
@@ -259,12 +271,15 @@ async def _sync_m3u_provider(db, provider, matcher, quality_analyzer):
             logger.error(f"Error processing channel {channel_data.get('name')}: {str(e)}")
             continue
 
+    if new_streams:
+        await db.execute(insert(ChannelStream), new_streams)
+
     # Update provider stats
     provider.total_channels = channel_count
     provider.active_channels = channel_count
 
     await db.commit()
-    logger.info(f"Synced {channel_count} channels and {stream_count} new streams")
+    logger.info(f"Synced {channel_count} channels and {len(new_streams)} new streams")
 
 
 async def _find_or_create_channel(db, name, normalized_name, category, region, variant, logo_url, matcher):
@@ -326,7 +341,6 @@ async def _find_or_create_channel(db, name, normalized_name, category, region, v
         # Update channel info if needed
         if not matching_channel.logo_url and logo_url:
             matching_channel.logo_url = logo_url
-        matching_channel.stream_count += 1
         
         return matching_channel, merge_info
     else:
@@ -338,8 +352,7 @@ async def _find_or_create_channel(db, name, normalized_name, category, region, v
             region=region,
             variant=variant,
             logo_url=logo_url,
-            enabled=True,
-            stream_count=1
+            enabled=True
         )
         db.add(new_channel)
         await db.flush()  # Get ID
@@ -2,6 +2,7 @@
 import logging
 from sqlalchemy import select
 from app.tasks.celery_app import celery_app
+from app.core.cache import CacheManager
 from app.core.database import get_session_factory
 from app.core.config import settings
 from app.models.provider import Provider
@@ -64,6 +65,7 @@ async def _sync_vod_content_async(provider_id: int):
             await _sync_series(db, provider, xstream)
 
             await db.commit()
+            await CacheManager.invalidate_vod_cache()
             logger.info(f"VOD sync completed for provider: {provider.name}")
 
         except Exception as e:
@@ -150,6 +152,13 @@ async def _sync_series(db, provider, xstream):
         series_count = 0
         episode_count = 0
 
+        # Load the provider's existing titles once instead of querying per series
+        existing_titles = set(
+            (await db.execute(
+                select(VODSeries.normalized_title).where(VODSeries.provider_id == provider.id)
+            )).scalars()
+        )
+
         for series_data in series_list:
             try:
                 series_id = series_data.get('series_id')
@@ -159,16 +168,8 @@ async def _sync_series(db, provider, xstream):
                 title = series_data.get('name', '')
                 normalized_title = title.lower().strip()
 
-                # Check if series already exists
-                existing_series = await db.execute(
-                    select(VODSeries).where(
-                        VODSeries.provider_id == provider.id,
-                        VODSeries.normalized_title == normalized_title
-                    )
-                )
-                existing_series = existing_series.scalar_one_or_none()
-
-                if existing_series:
+                # Skip series that already exist
+                if normalized_title in existing_titles:
                     continue
 
                 # Get series info with episodes
@@ -188,7 +189,7 @@ async def _sync_series(db, provider, xstream):
                 )
 
                 db.add(new_series)
-                await db.flush()  # Get series ID
+                existing_titles.add(normalized_title)
 
                 # Add episodes
                 episodes_data = series_info.get('episodes', {})
@@ -208,8 +209,9 @@ async def _sync_series(db, provider, xstream):
 
                             stream_url = xstream.get_series_stream_url(episode_id, 'mp4')
 
+                            # Linked through the relationship, so no flush is needed for the series ID
                             new_episode = VODEpisode(
-                                series_id=new_series.id,
+                                series=new_series,
                                 title=episode_data.get('title'),
                                 season_number=season_number,
                                 episode_number=episode_num,
@@ -0,0 +1,18 @@
+"""Filesystem path helpers."""
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=4096)
+def ensure_dir(path: Path) -> Path:
+    """Create ``path`` (and parents) on first use; later calls skip the syscalls.
+
+    Call ``forget_dirs`` after removing a directory so it is recreated next time.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def forget_dirs() -> None:
+    """Drop the record of created directories after any directory is removed."""
+    ensure_dir.cache_clear()
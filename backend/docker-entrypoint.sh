@@ -49,4 +49,4 @@ fi
 
 # Start the application
 echo "✅ Launching Uvicorn on port ${BACKEND_PORT:-8000}"
-exec uvicorn app.main:app --host 0.0.0.0 --port ${BACKEND_PORT:-8000}
\ No newline at end of file
+exec uvicorn app.main:app --host 0.0.0.0 --port ${BACKEND_PORT:-8000} --loop uvloop
\ No newline at end of file
@@ -96,4 +96,4 @@ else
 fi
 
 echo "✅ Launching Uvicorn"
-exec python -m uvicorn app.main:app --host 0.0.0.0 --port 8000
+exec python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 --loop uvloop